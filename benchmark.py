@@ -28,26 +28,141 @@ Output:
 """
 
 import argparse
+import atexit
+import contextlib
 import csv
-import glob
+import importlib
+import itertools
+import multiprocessing
 import os
+import sys
 import time
-from concurrent.futures import ProcessPoolExecutor, as_completed
-from typing import Any, Dict, List, Optional
-
-from tabulate import tabulate
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Dict, Iterator, List, Optional
 
 from pdfparser import is_valid_parse, load_config, parse_pdf
 
 # Available parser names
 PARSER_CHOICES = ['pymupdf', 'pdfplumber', 'pypdf', 'pdfoxide', 'all']
 
+# Write buffer size for benchmark CSV output (1 MiB)
+CSV_WRITE_BUFFER_SIZE = 1 << 20
+
+# Columns of the detailed benchmark results CSV
+RESULT_FIELDNAMES = [
+    'file_path',
+    'parser',
+    'success',
+    'transaction_count',
+    'parse_time_seconds',
+    'page_count',
+    'error',
+]
+
+# Parser backend modules imported by each worker at startup
+PARSER_MODULES = [
+    'pdfparser.pymupdf_parser',
+    'pdfparser.pdfplumber_parser',
+    'pdfparser.pypdf_parser',
+    'pdfparser.pdfoxide_parser',
+]
+
+# Persistent worker pool, reused across run_benchmark() invocations
+_POOL: Optional[ProcessPoolExecutor] = None
+_POOL_WORKERS = 0
+
+
+def _worker_init() -> None:
+    """
+    Warm-start a worker process by importing all parser backends.
+
+    Runs once per worker so the heavy PDF library imports are paid at pool
+    startup rather than on the first task each worker receives. A backend
+    that fails to import is skipped; its tasks report the error instead
+    (an initializer exception would break the pool).
+    """
+    for module_name in PARSER_MODULES:
+        try:
+            importlib.import_module(module_name)
+        except ImportError:
+            pass
+
+
+def _close_pool() -> None:
+    """Shut down the persistent worker pool, if one was created."""
+    global _POOL, _POOL_WORKERS
+    if _POOL is not None:
+        _POOL.shutdown(wait=True)
+        _POOL = None
+        _POOL_WORKERS = 0
+
+
+atexit.register(_close_pool)
+
+
+def get_pool(workers: int) -> ProcessPoolExecutor:
+    """
+    Get the persistent worker pool, creating it on first use.
+
+    The pool is cached at module scope and reused across benchmark runs.
+    It is recreated only when a different worker count is requested, or
+    after a dead worker broke it.
+
+    Args:
+        workers: Number of worker processes
+
+    Returns:
+        ProcessPoolExecutor with warm-started workers
+    """
+    global _POOL, _POOL_WORKERS
+    if _POOL is not None and _POOL_WORKERS != workers:
+        _close_pool()
+
+    if _POOL is None:
+        # forkserver keeps worker startup cheap; fall back to the platform default
+        start_method = (
+            "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else None
+        )
+        _POOL = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context(start_method),
+            initializer=_worker_init,
+        )
+        _POOL_WORKERS = workers
+
+    return _POOL
+
+
+def _new_result(file_path: str, parser_name: str) -> Dict[str, Any]:
+    """
+    Create a benchmark result dict with every RESULT_FIELDNAMES key set.
+
+    All results share this schema, so aggregation can index keys directly.
+
+    Args:
+        file_path: Path to the PDF file
+        parser_name: Parser name used
+
+    Returns:
+        Result dict with default (failed) values
+    """
+    return {
+        'file_path': file_path,
+        'parser': parser_name,
+        'success': False,
+        'transaction_count': 0,
+        'parse_time_seconds': 0.0,
+        'page_count': 0,
+        'error': None,
+    }
+
 
 def parse_single_pdf(args: tuple) -> Dict[str, Any]:
     """
     Parse a single PDF file and return timing metrics.
 
-    This function is designed to be called by ProcessPoolExecutor
+    This function is designed to be called by a ProcessPoolExecutor
     for parallel processing. It is multiprocessing-safe with no global state.
 
     Args:
@@ -65,15 +180,7 @@ def parse_single_pdf(args: tuple) -> Dict[str, Any]:
     """
     file_path, parser_name = args
 
-    result = {
-        'file_path': file_path,
-        'parser': parser_name,
-        'success': False,
-        'transaction_count': 0,
-        'parse_time_seconds': 0.0,
-        'page_count': 0,
-        'error': None,
-    }
+    result = _new_result(file_path, parser_name)
 
     try:
         start_time = time.perf_counter()
@@ -99,35 +206,82 @@ def parse_single_pdf(args: tuple) -> Dict[str, Any]:
     return result
 
 
-def discover_pdfs(test_dir: str, max_files: Optional[int] = None) -> List[str]:
+def _walk_pdfs(root: str, sort: bool = False) -> Iterator[str]:
+    """
+    Lazily yield PDF paths under a directory using os.scandir.
+
+    Hidden entries are skipped to match glob semantics. Only regular files
+    are yielded (using the DirEntry's cached type), so broken symlinks and
+    other non-files are filtered out before any task is dispatched.
+
+    Args:
+        root: Directory to walk
+        sort: Visit entries in sorted path order for deterministic output
+
+    Yields:
+        Paths to PDF files
+    """
+    with os.scandir(root) as it:
+        # A directory sorts as "name/" so the walk matches sorted full paths
+        entries = (
+            sorted(it, key=lambda e: e.name + '/' if e.is_dir(follow_symlinks=False) else e.name)
+            if sort
+            else list(it)
+        )
+    for entry in entries:
+        if entry.name.startswith('.'):
+            continue
+        if entry.is_dir(follow_symlinks=False):
+            yield from _walk_pdfs(entry.path, sort)
+        elif entry.name.endswith('.pdf') and entry.is_file():
+            yield entry.path
+
+
+def discover_pdfs(
+    test_dir: str,
+    max_files: Optional[int] = None,
+    sort: bool = False,
+) -> List[str]:
     """
     Discover PDF files in the specified directory.
 
     Args:
         test_dir: Directory path to search for PDFs
         max_files: Maximum number of files to return (None for all)
+        sort: Return paths in sorted order (default: filesystem order, since
+            results are collected out of order anyway). Always on when
+            max_files is set, so the same subset is picked on every run
 
     Returns:
         List of paths to discovered PDF files
     """
-    pdf_pattern = os.path.join(test_dir, '**', '*.pdf')
-    pdf_files = glob.glob(pdf_pattern, recursive=True)
-
-    # Sort for consistent ordering
-    pdf_files = sorted(pdf_files)
+    if not os.path.isdir(test_dir):
+        return []
 
+    # Walk stops early once max_files paths have been found; it visits
+    # entries in sorted order so the first max_files are reproducible
     if max_files is not None and max_files > 0:
-        pdf_files = pdf_files[:max_files]
+        return list(itertools.islice(_walk_pdfs(test_dir, sort=True), max_files))
 
-    return pdf_files
+    return list(_walk_pdfs(test_dir, sort))
 
 
-def calculate_metrics(results: List[Dict[str, Any]]) -> Dict[str, Any]:
+def _build_metrics(
+    total_files: int,
+    successful: int,
+    total_time: float,
+    total_transactions: int,
+    total_pages: int,
+) -> Dict[str, Any]:
     """
-    Calculate aggregate metrics from benchmark results.
+    Build the aggregate metrics dict from accumulated totals.
 
     Args:
-        results: List of individual parse results
+        total_files: Number of files processed
+        successful: Number of successful parses
+        total_time: Sum of all parse times
+        total_transactions: Sum of all transactions extracted
+        total_pages: Sum of all page counts (0 if unavailable)
 
     Returns:
         Dict containing aggregate metrics:
@@ -141,154 +295,129 @@ def calculate_metrics(results: List[Dict[str, Any]]) -> Dict[str, Any]:
             - total_transactions: Sum of all transactions extracted
             - avg_transactions_per_file: Average transactions per file
     """
-    total_files = len(results)
-    successful = sum(1 for r in results if r['success'])
-    failed = total_files - successful
-
-    total_time = sum(r['parse_time_seconds'] for r in results)
-    total_transactions = sum(r['transaction_count'] for r in results)
-
-    metrics = {
+    return {
         'total_files': total_files,
         'successful': successful,
-        'failed': failed,
+        'failed': total_files - successful,
         'success_rate': (successful / total_files * 100) if total_files > 0 else 0.0,
         'total_time_seconds': total_time,
         'avg_time_per_file': total_time / total_files if total_files > 0 else 0.0,
-        'avg_time_per_page': 0.0,
+        # Time per page is only available when page counts were recorded
+        'avg_time_per_page': total_time / total_pages if total_pages > 0 else 0.0,
         'total_transactions': total_transactions,
         'avg_transactions_per_file': total_transactions / total_files if total_files > 0 else 0.0,
     }
 
-    # Calculate time per page if page counts are available
-    pages_with_count = [r for r in results if r.get('page_count', 0) > 0]
-    if pages_with_count:
-        total_pages = sum(r.get('page_count', 0) for r in results)
-        metrics['avg_time_per_page'] = total_time / total_pages if total_pages > 0 else 0.0
-
-    return metrics
-
 
 def run_benchmark(
     parsers: List[str],
     test_dir: str,
     max_files: Optional[int] = None,
     max_workers: int = 4,
-) -> List[Dict[str, Any]]:
+    output_path: Optional[str] = None,
+) -> Dict[str, Dict[str, Any]]:
     """
     Run the benchmark across specified parsers and PDF files.
 
+    Results are streamed to the CSV file as they come back from the workers
+    (in task order) and folded into per-parser totals, so memory use stays
+    flat regardless of run size.
+
     Args:
         parsers: List of parser names to benchmark
         test_dir: Directory containing PDF files
         max_files: Maximum number of PDFs to process
         max_workers: Maximum parallel workers
+        output_path: Path for the detailed results CSV (None to skip writing)
 
     Returns:
-        List of all benchmark results
+        Dict mapping parser name to its aggregate metrics (empty if no PDFs found)
     """
     # Discover PDF files
-    pdf_files = discover_pdfs(test_dir, max_files)
+    pdf_files = discover_pdfs(test_dir, max_files, sort=False)
 
     if not pdf_files:
         print(f"No PDF files found in {test_dir}")
-        return []
+        return {}
 
     print(f"Found {len(pdf_files)} PDF files to benchmark")
     print(f"Running with {max_workers} parallel workers")
 
-    # Prepare all (file, parser) combinations
-    tasks = [(pdf, parser) for pdf in pdf_files for parser in parsers]
-
-    all_results = []
-
-    # Run with ProcessPoolExecutor for parallel processing
-    with ProcessPoolExecutor(max_workers=max_workers) as executor:
-        # Submit all tasks
-        futures = {executor.submit(parse_single_pdf, task): task for task in tasks}
-
-        # Collect results as they complete
-        for future in as_completed(futures):
-            try:
-                result = future.result()
-                all_results.append(result)
-            except Exception as e:
-                task = futures[future]
-                all_results.append({
-                    'file_path': task[0],
-                    'parser': task[1],
-                    'success': False,
-                    'error': str(e),
-                })
-
-    return all_results
-
+    # Prepare all (file, parser) combinations in parser-major order so each
+    # worker chunk mostly exercises a single backend; interned parser names
+    # are shared by every task tuple
+    parsers = [sys.intern(p) for p in parsers]
+    tasks = [(pdf, parser) for parser in parsers for pdf in pdf_files]
+
+    totals_by_parser: Dict[str, List[Any]] = {}
+
+    # Ship tasks to workers in chunks to amortize per-task pickling/IPC cost
+    chunksize = max(1, len(tasks) // (max_workers * 8))
+
+    pool = get_pool(max_workers)
+    with contextlib.ExitStack() as stack:
+        writer = None
+        if output_path is not None:
+            # Large write buffer keeps the number of write() syscalls low
+            csvfile = stack.enter_context(
+                open(output_path, 'w', newline='', encoding='utf-8', buffering=CSV_WRITE_BUFFER_SIZE)
+            )
+            writer = csv.DictWriter(csvfile, fieldnames=RESULT_FIELDNAMES, extrasaction='ignore')
+            writer.writeheader()
+
+        # A worker killed mid-task (OOM, native crash) breaks the pool and
+        # fails the run instead of leaving it waiting for the lost result
+        try:
+            for result in pool.map(parse_single_pdf, tasks, chunksize=chunksize):
+                if writer is not None:
+                    writer.writerow(result)
+                _add_to_totals(totals_by_parser, result)
+        except BrokenProcessPool:
+            _close_pool()
+            raise
+
+    return _aggregate_totals(totals_by_parser)
+
+
+def _add_to_totals(totals_by_parser: Dict[str, List[Any]], result: Dict[str, Any]) -> None:
+    """
+    Fold a single benchmark result into its parser's running totals.
 
-def aggregate_by_parser(results: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    Args:
+        totals_by_parser: Dict mapping parser name to
+            [files, successful, time, transactions, pages]; updated in place
+        result: Single parse result from parse_single_pdf
+    """
+    totals = totals_by_parser.get(result['parser'])
+    if totals is None:
+        totals = totals_by_parser[result['parser']] = [0, 0, 0.0, 0, 0]
+    totals[0] += 1
+    if result['success']:
+        totals[1] += 1
+    totals[2] += result['parse_time_seconds']
+    totals[3] += result['transaction_count']
+    totals[4] += result['page_count']
+
+
+def _aggregate_totals(totals_by_parser: Dict[str, List[Any]]) -> Dict[str, Dict[str, Any]]:
     """
-    Aggregate benchmark results by parser.
+    Convert per-parser running totals into aggregate metrics.
 
     Args:
-        results: List of all benchmark results
+        totals_by_parser: Dict mapping parser name to running totals
 
     Returns:
         Dict mapping parser name to its aggregate metrics
     """
-    by_parser: Dict[str, List[Dict[str, Any]]] = {}
-
-    for result in results:
-        parser = result['parser']
-        if parser not in by_parser:
-            by_parser[parser] = []
-        by_parser[parser].append(result)
-
     aggregated = {}
-    for parser, parser_results in by_parser.items():
-        metrics = calculate_metrics(parser_results)
+    for parser, totals in totals_by_parser.items():
+        metrics = _build_metrics(*totals)
         metrics['parser'] = parser
         aggregated[parser] = metrics
 
     return aggregated
 
 
-def save_results_csv(
-    results: List[Dict[str, Any]],
-    output_path: str,
-    config: Dict[str, Any],
-) -> None:
-    """
-    Save benchmark results to CSV file.
-
-    Args:
-        results: List of benchmark results
-        output_path: Path for output CSV file
-        config: Project configuration
-    """
-    output_dir = config.get('output_dir', 'output')
-
-    # Ensure output directory exists
-    os.makedirs(output_dir, exist_ok=True)
-
-    full_path = os.path.join(output_dir, output_path)
-
-    fieldnames = [
-        'file_path',
-        'parser',
-        'success',
-        'transaction_count',
-        'parse_time_seconds',
-        'page_count',
-        'error',
-    ]
-
-    with open(full_path, 'w', newline='', encoding='utf-8') as csvfile:
-        writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(results)
-
-    print(f"Results saved to {full_path}")
-
-
 def print_summary_table(aggregated: Dict[str, Dict[str, Any]]) -> None:
     """
     Print benchmark summary table using tabulate.
@@ -296,6 +425,9 @@ def print_summary_table(aggregated: Dict[str, Dict[str, Any]]) -> None:
     Args:
         aggregated: Dict mapping parser name to aggregate metrics
     """
+    # Imported here so tabulate isn't loaded at CLI startup (or in workers)
+    from tabulate import tabulate
+
     table_data = []
 
     for parser, metrics in sorted(aggregated.items()):
@@ -378,26 +510,29 @@ def main() -> None:
     print("Starting benchmark...")
     start_time = time.perf_counter()
 
-    results = run_benchmark(
+    # Detailed results are streamed to CSV while the benchmark runs
+    output_dir = config.get('output_dir', 'output')
+    os.makedirs(output_dir, exist_ok=True)
+    results_path = os.path.join(output_dir, 'benchmark_results.csv')
+
+    aggregated = run_benchmark(
         parsers=parsers,
         test_dir=args.test_dir,
         max_files=args.max_files,
         max_workers=args.max_workers,
+        output_path=results_path,
     )
 
     total_time = time.perf_counter() - start_time
 
-    if not results:
+    if not aggregated:
         print("No results to display")
         return
 
-    # Aggregate and display results
-    aggregated = aggregate_by_parser(results)
-
+    # Display aggregated results
     print_summary_table(aggregated)
 
-    # Save detailed results to CSV
-    save_results_csv(results, 'benchmark_results.csv', config)
+    print(f"Results saved to {results_path}")
 
     # Print overall summary
     print(f"\nBenchmark completed in {total_time:.2f} seconds")
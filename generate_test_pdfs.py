@@ -17,15 +17,19 @@ Arguments:
     --max-pages: Maximum pages per PDF (default: 10)
     --min-transactions: Minimum transactions per page (default: 100)
     --max-transactions: Maximum transactions per page (default: 500)
+    --max-workers: Parallel worker processes (default: CPU count)
 """
 
 import argparse
+import io
 import os
 import random
 import string
+import time
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 from reportlab.lib.pagesizes import letter
 from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
@@ -83,17 +87,22 @@ def random_address() -> str:
     return f"{street_num} {random.choice(street_names)}, Jakarta Pusat"
 
 
-def random_transaction_description() -> str:
-    """Generate a random transaction description."""
-    descriptions = [
-        'Transfer Masuk', 'Transfer Keluar', 'Pembayaran Listrik',
-        'Pembayaran Air', 'Pembayaran Telepon', 'Pembayaran Internet',
-        'Setoran Tunai', 'Penarikan Tunai', 'Pembayaran Kartu Kredit',
-        'Pembayaran Asuransi', 'Investasi Reksa Dana', 'Pembelian Emas',
-        'Top Up E-Wallet', 'Pembayaran Toko Online', 'Biaya Admin',
-        'Bunga Tabungan', 'Denda Keterlambatan', 'Pembayaran Cicilan',
-    ]
-    return random.choice(descriptions)
+TRANSACTION_DESCRIPTIONS = [
+    'Transfer Masuk', 'Transfer Keluar', 'Pembayaran Listrik',
+    'Pembayaran Air', 'Pembayaran Telepon', 'Pembayaran Internet',
+    'Setoran Tunai', 'Penarikan Tunai', 'Pembayaran Kartu Kredit',
+    'Pembayaran Asuransi', 'Investasi Reksa Dana', 'Pembelian Emas',
+    'Top Up E-Wallet', 'Pembayaran Toko Online', 'Biaya Admin',
+    'Bunga Tabungan', 'Denda Keterlambatan', 'Pembayaran Cicilan',
+]
+
+# Value ranges for bulk random draws (random.choices indexes ranges directly)
+AMOUNT_RANGE = range(10000, 5000001)
+BALANCE_RANGE = range(1000000, 100000001)
+DAYS_OFFSET_RANGE = range(0, 31)
+
+# Write buffer size for generated PDF files (1 MiB)
+PDF_WRITE_BUFFER_SIZE = 1 << 20
 
 
 def generate_random_transactions(
@@ -103,6 +112,9 @@ def generate_random_transactions(
     """
     Generate random transaction data.
 
+    All random values are drawn in bulk up front with random.choices
+    instead of several random calls per transaction.
+
     Args:
         start_date: Starting date for transactions
         num_transactions: Number of transactions to generate
@@ -110,39 +122,39 @@ def generate_random_transactions(
     Returns:
         List of transaction dicts
     """
-    transactions = []
-    current_date = start_date
+    n = num_transactions
 
-    for _ in range(num_transactions):
-        # Randomly decide transaction type
-        is_credit = random.random() > 0.4  # 60% credit, 40% debit
+    # Randomly decide transaction types (60% credit, 40% debit)
+    is_credit = random.choices((True, False), weights=(60, 40), k=n)
 
-        # Generate random amounts
-        amount = random.randint(10000, 5000000)
-        balance = random.randint(1000000, 100000000)
+    # Generate random amounts and balances
+    amounts = random.choices(AMOUNT_RANGE, k=n)
+    balances = random.choices(BALANCE_RANGE, k=n)
 
-        # Transaction date (within last 30 days from start)
-        days_offset = random.randint(0, 30)
-        current_date = start_date + timedelta(days=days_offset)
+    # Transaction dates (within last 30 days from start), sorted so the
+    # transactions come out in chronological order without a post-hoc sort
+    days_offsets = sorted(random.choices(DAYS_OFFSET_RANGE, k=n))
 
-        # Generate user name
-        first_name = random.choice(FIRST_NAMES)
-        last_name = random.choice(LAST_NAMES)
-        user_name = f"{first_name} {last_name}"
+    # Generate user names and descriptions
+    first_names = random.choices(FIRST_NAMES, k=n)
+    last_names = random.choices(LAST_NAMES, k=n)
+    descriptions = random.choices(TRANSACTION_DESCRIPTIONS, k=n)
+
+    transactions = []
+    for k in range(n):
+        current_date = start_date + timedelta(days=days_offsets[k])
+        amount = f"{amounts[k]:,.2f}"
 
         txn = {
             'date': current_date.strftime('%d/%m/%y %H:%M:%S'),
-            'description': random_transaction_description(),
-            'user': user_name,
-            'debit': f"{amount:,.2f}" if not is_credit else '',
-            'credit': f"{amount:,.2f}" if is_credit else '',
-            'balance': f"{balance:,.2f}",
+            'description': descriptions[k],
+            'user': f"{first_names[k]} {last_names[k]}",
+            'debit': amount if not is_credit[k] else '',
+            'credit': amount if is_credit[k] else '',
+            'balance': f"{balances[k]:,.2f}",
         }
         transactions.append(txn)
 
-    # Sort by date
-    transactions.sort(key=lambda x: x['date'])
-
     return transactions
 
 
@@ -243,9 +255,10 @@ def generate_single_pdf(
         for i in range(num_pages)
     ]
 
-    # Create PDF document
+    # Create PDF document in memory; it is written to disk in one call below
+    buffer = io.BytesIO()
     doc = SimpleDocTemplate(
-        output_path,
+        buffer,
         pagesize=letter,
         rightMargin=72,
         leftMargin=72,
@@ -253,6 +266,15 @@ def generate_single_pdf(
         bottomMargin=72,
     )
 
+    # Build styles once; they are shared by every page and line
+    styles = getSampleStyleSheet()
+    body_style = ParagraphStyle(
+        'BodyText',
+        parent=styles['Normal'],
+        fontSize=8,
+        leading=10,
+    )
+
     # Build content for each page
     story = []
 
@@ -265,22 +287,16 @@ def generate_single_pdf(
         content = create_pdf_content(metadata, page_transactions)
 
         # Add to story as paragraphs (to handle long text)
-        styles = getSampleStyleSheet()
-        body_style = ParagraphStyle(
-            'BodyText',
-            parent=styles['Normal'],
-            fontSize=8,
-            leading=10,
-        )
-
         for line in content.split('\n'):
             if line.strip():
                 story.append(Paragraph(line, body_style))
             else:
                 story.append(Spacer(1, 6))
 
-    # Build PDF
+    # Build PDF and write it out with a single large write
     doc.build(story)
+    with open(output_path, 'wb', buffering=PDF_WRITE_BUFFER_SIZE) as pdf_file:
+        pdf_file.write(buffer.getvalue())
 
     return {
         'file_path': output_path,
@@ -290,6 +306,29 @@ def generate_single_pdf(
     }
 
 
+def _seed_worker() -> None:
+    """Seed each worker's RNG independently so forked workers don't repeat data."""
+    random.seed(os.getpid() ^ time.time_ns())
+
+
+def _generate_one(params: tuple) -> Dict[str, Any]:
+    """
+    Generate a single PDF from a parameter tuple.
+
+    Args:
+        params: Tuple of (output_path, num_pages, transactions_per_page)
+
+    Returns:
+        Dict with generation metadata (see generate_single_pdf)
+    """
+    output_path, num_pages, transactions_per_page = params
+    return generate_single_pdf(
+        output_path=output_path,
+        num_pages=num_pages,
+        transactions_per_page=transactions_per_page,
+    )
+
+
 def generate_test_pdfs(
     num_pdfs: int = 100,
     output_dir: str = 'test-pdfs',
@@ -297,10 +336,13 @@ def generate_test_pdfs(
     max_pages: int = 10,
     min_transactions: int = 100,
     max_transactions: int = 500,
+    max_workers: Optional[int] = None,
 ) -> List[Dict[str, Any]]:
     """
     Generate multiple test PDF bank statements.
 
+    PDFs are independent, so they are built in parallel worker processes.
+
     Args:
         num_pdfs: Number of PDFs to generate
         output_dir: Output directory for PDFs
@@ -308,6 +350,7 @@ def generate_test_pdfs(
         max_pages: Maximum pages per PDF
         min_transactions: Minimum transactions per page
         max_transactions: Maximum transactions per page
+        max_workers: Parallel worker processes (default: CPU count)
 
     Returns:
         List of generation results for each PDF
@@ -319,28 +362,26 @@ def generate_test_pdfs(
 
     print(f"Generating {num_pdfs} test PDFs in '{output_dir}'...")
 
-    for i in range(num_pdfs):
-        # Randomize page count and transactions
-        num_pages = random.randint(min_pages, max_pages)
-        transactions_per_page = random.randint(min_transactions, max_transactions)
-
-        # Generate unique filename
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        file_name = f"test_statement_{i:04d}_{timestamp}.pdf"
-        output_path = os.path.join(output_dir, file_name)
-
-        # Generate PDF
-        result = generate_single_pdf(
-            output_path=output_path,
-            num_pages=num_pages,
-            transactions_per_page=transactions_per_page,
+    # Randomize page count and transactions up front, with unique filenames
+    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    params = [
+        (
+            os.path.join(output_dir, f"test_statement_{i:04d}_{timestamp}.pdf"),
+            random.randint(min_pages, max_pages),
+            random.randint(min_transactions, max_transactions),
         )
+        for i in range(num_pdfs)
+    ]
 
-        results.append(result)
+    with ProcessPoolExecutor(
+        max_workers=max_workers or os.cpu_count(), initializer=_seed_worker
+    ) as executor:
+        for i, result in enumerate(executor.map(_generate_one, params, chunksize=8)):
+            results.append(result)
 
-        # Progress indicator
-        if (i + 1) % 10 == 0 or i + 1 == num_pdfs:
-            print(f"  Generated {i + 1}/{num_pdfs} PDFs...")
+            # Progress indicator
+            if (i + 1) % 10 == 0 or i + 1 == num_pdfs:
+                print(f"  Generated {i + 1}/{num_pdfs} PDFs...")
 
     print(f"Completed! Generated {num_pdfs} PDFs in '{output_dir}'")
 
@@ -396,6 +437,13 @@ def main() -> None:
         help='Maximum transactions per page (default: 500)',
     )
 
+    parser.add_argument(
+        '--max-workers',
+        type=int,
+        default=None,
+        help='Parallel worker processes (default: CPU count)',
+    )
+
     args = parser.parse_args()
 
     # Generate PDFs
@@ -406,6 +454,7 @@ def main() -> None:
         max_pages=args.max_pages,
         min_transactions=args.min_transactions,
         max_transactions=args.max_transactions,
+        max_workers=args.max_workers,
     )
 
     # Print summary
@@ -17,17 +17,16 @@ Usage:
     result = parser.parse('statement.pdf')
 """
 
-from typing import Dict, List, Optional, Union
+import importlib
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
 
-from pdfparser.batch import batch_parse, batch_parse_from_directory
-from pdfparser.pdfoxide_parser import parse_pdf_pdfoxide
-from pdfparser.pdfplumber_parser import parse_pdf_pdfplumber
-from pdfparser.pymupdf_parser import parse_pdf_pymupdf
-from pdfparser.pypdf_parser import parse_pdf_pypdf
 from pdfparser.utils import (
+    PARSER_BACKENDS,
+    VALID_PARSERS,
     ensure_output_dirs,
     extract_metadata,
     extract_transactions,
+    get_parser_func,
     is_valid_parse,
     load_config,
     save_metadata_csv,
@@ -37,6 +36,36 @@ from pdfparser.utils import (
     verify_turnover as verify_turnover_func,
 )
 
+if TYPE_CHECKING:
+    from pdfparser.batch import batch_parse, batch_parse_from_directory, batch_parse_iter
+    from pdfparser.pdfoxide_parser import parse_pdf_pdfoxide
+    from pdfparser.pdfplumber_parser import parse_pdf_pdfplumber
+    from pdfparser.pymupdf_parser import parse_pdf_pymupdf
+    from pdfparser.pypdf_parser import parse_pdf_pypdf
+
+# Parser backends and batch helpers are resolved on first attribute access
+# (PEP 562) so that `import pdfparser` (and forkserver/spawn worker startup)
+# does not pull in every PDF library.
+_LAZY_ATTRS: Dict[str, str] = {
+    "parse_pdf_pymupdf": "pdfparser.pymupdf_parser",
+    "parse_pdf_pdfplumber": "pdfparser.pdfplumber_parser",
+    "parse_pdf_pypdf": "pdfparser.pypdf_parser",
+    "parse_pdf_pdfoxide": "pdfparser.pdfoxide_parser",
+    "batch_parse": "pdfparser.batch",
+    "batch_parse_from_directory": "pdfparser.batch",
+    "batch_parse_iter": "pdfparser.batch",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve lazily imported public names on first access."""
+    module_path = _LAZY_ATTRS.get(name)
+    if module_path is None:
+        raise AttributeError(f"module 'pdfparser' has no attribute '{name}'")
+    value = getattr(importlib.import_module(module_path), name)
+    globals()[name] = value
+    return value
+
 
 class PDFParser:
     """
@@ -61,7 +90,7 @@ class PDFParser:
         result = parser.parse('statement.pdf')
     """
 
-    VALID_PARSERS = ("pymupdf", "pdfplumber", "pypdf", "pdfoxide")
+    VALID_PARSERS = VALID_PARSERS
 
     def __init__(self, parser: str = "pymupdf", verify_turnover: Optional[bool] = None):
         """
@@ -72,17 +101,24 @@ class PDFParser:
                 'pdfplumber' (table extraction), 'pypdf' (pure Python), 'pdfoxide' (Rust-based)
             verify_turnover: Whether to verify turnover totals against PDF summary.
                 True = enable, False = disable, None = use VERIFY_TURNOVER from .env
+                (resolved once, when the parser is created)
 
         Raises:
             ValueError: If parser name is invalid
+            ImportError: If the selected parser library is not installed
         """
         if parser not in self.VALID_PARSERS:
             raise ValueError(
-                f"Invalid parser: {parser}. Choose from: {', '.join(self.VALID_PARSERS)}"
+                f"Invalid parser: {parser}. Choose from: {', '.join(PARSER_BACKENDS)}"
             )
         self.parser = parser
         self.verify_turnover = verify_turnover
 
+        # Resolve the backend function and verification setting once, so
+        # parse() calls go straight to the parser without per-call dispatch
+        self._parser_func = get_parser_func(parser)
+        self._should_verify = _should_verify(verify_turnover)
+
     def parse(self, path: str) -> Dict[str, Union[Dict, List, None]]:
         """
         Parse a PDF bank statement file.
@@ -103,7 +139,8 @@ class PDFParser:
             FileNotFoundError: If PDF file doesn't exist
             ValueError: If parser name is invalid
         """
-        return parse_pdf(path, parser=self.parser, verify_turnover=self.verify_turnover)
+        result = self._parser_func(path, need_full_text=self._should_verify)
+        return _finalize_result(result, self._should_verify)
 
     def __repr__(self) -> str:
         return f"PDFParser(parser='{self.parser}', verify_turnover={self.verify_turnover})"
@@ -130,36 +167,50 @@ def parse_pdf(path: str, parser: str = "pymupdf", verify_turnover: Optional[bool
         FileNotFoundError: If PDF file doesn't exist
     """
     # Determine if verification should be enabled
+    should_verify = _should_verify(verify_turnover)
+
+    # Parse the PDF based on selected parser (backend imported on first use);
+    # full page text is only needed for turnover verification
+    result = get_parser_func(parser)(path, need_full_text=should_verify)
+
+    return _finalize_result(result, should_verify)
+
+
+def _should_verify(verify_turnover: Optional[bool]) -> bool:
+    """
+    Resolve whether turnover verification is enabled.
+
+    Args:
+        verify_turnover: True/False to force, None to use VERIFY_TURNOVER from .env
+
+    Returns:
+        True if verification should run
+    """
     if verify_turnover is None:
         config = load_config()
-        should_verify = config.get("verify_turnover", "").lower() == "true"
-    else:
-        should_verify = verify_turnover
-
-    # Parse the PDF based on selected parser
-    if parser == "pymupdf":
-        result = parse_pdf_pymupdf(path)
-    elif parser == "pdfplumber":
-        result = parse_pdf_pdfplumber(path)
-    elif parser == "pypdf":
-        result = parse_pdf_pypdf(path)
-    elif parser == "pdfoxide":
-        result = parse_pdf_pdfoxide(path)
-    else:
-        raise ValueError(
-            f"Invalid parser: {parser}. Choose 'pymupdf', 'pdfplumber', 'pypdf', or 'pdfoxide'"
-        )
+        return config.get("verify_turnover", "").lower() == "true"
+    return verify_turnover
+
+
+def _finalize_result(result: Dict[str, Any], should_verify: bool) -> Dict[str, Any]:
+    """
+    Add turnover verification (if enabled) to a parser result.
 
-    # Add verification if enabled
+    Args:
+        result: Raw result dict returned by a parse_pdf_* backend
+        should_verify: Whether to add the 'verification' key
+
+    Returns:
+        The same result dict, ready to return to callers
+    """
+    # Add verification if enabled; backends only include full_text when
+    # should_verify was passed as need_full_text, so there is nothing to strip otherwise
     if should_verify:
-        full_text = result.get("full_text", "")
+        full_text = result.pop("full_text", "")
         result["verification"] = verify_turnover_func(
             result.get("transactions", []), summary_text=full_text
         )
 
-    # Remove full_text from result to keep output clean
-    result.pop("full_text", None)
-
     return result
 
 
@@ -172,6 +223,7 @@ __all__ = [
     "parse_pdf_pdfoxide",
     "batch_parse",
     "batch_parse_from_directory",
+    "batch_parse_iter",
     "extract_metadata",
     "extract_transactions",
     "save_metadata_csv",
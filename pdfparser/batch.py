@@ -2,8 +2,9 @@
 Batch processing module for parallel PDF parsing.
 
 This module provides functions for processing large numbers of PDF files
-in parallel using ProcessPoolExecutor. It saves results to CSV files
-organized by metadata and transactions.
+in parallel using ProcessPoolExecutor (or ThreadPoolExecutor for thread-safe
+native backends). It saves results to CSV files organized by metadata and
+transactions.
 
 Usage:
     from pdfparser.batch import batch_parse, get_optimal_workers
@@ -24,39 +25,90 @@ Usage:
     )
 """
 
+import contextlib
+import csv
 import gc
+import json
+import logging
+import multiprocessing
 import os
+import stat
+import sys
 import time
-from concurrent.futures import ProcessPoolExecutor, as_completed
+from collections import deque
+from concurrent.futures import (
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
 from dataclasses import dataclass, field
-from pathlib import Path
-from typing import Any, Dict, List, Optional
+from functools import partial
+from typing import Any, Callable, Deque, Dict, Iterable, Iterator, List, Optional, Tuple
 
-from pdfparser.pdfoxide_parser import parse_pdf_pdfoxide
-from pdfparser.pdfplumber_parser import parse_pdf_pdfplumber
-from pdfparser.pymupdf_parser import parse_pdf_pymupdf
-from pdfparser.pypdf_parser import parse_pdf_pypdf
 from pdfparser.utils import (
+    PARSER_BACKENDS,
+    VALID_PARSERS,
+    _format_number_for_csv,
+    get_parser_func,
     is_valid_parse,
     load_config,
     save_metadata_csv,
     save_transactions_csv,
 )
 
-# Parser mapping
-PARSERS = {
-    "pymupdf": parse_pdf_pymupdf,
-    "pdfplumber": parse_pdf_pdfplumber,
-    "pypdf": parse_pdf_pypdf,
-    "pdfoxide": parse_pdf_pdfoxide,
-}
+try:
+    import orjson
+except ImportError:  # optional dependency, see the "fast" extra
+    orjson = None
+
+logger = logging.getLogger(__name__)
 
 # Constants
 DEFAULT_CHUNK_SIZE = 100
 DEFAULT_INIT_STRATEGY = "per-worker"
 MAX_WORKERS_CAP = 16
-VALID_PARSERS = ["pymupdf", "pdfplumber", "pypdf", "pdfoxide"]
-VALID_INIT_STRATEGIES = ["per-file", "per-worker"]
+# Threads cost no process startup or memory of their own, so thread-pool
+# batches (see THREADED_PARSERS) may use more workers than process pools
+MAX_THREAD_WORKERS_CAP = 32
+
+# Per-parser worker caps for process pools: PyMuPDF throughput plateaus
+# around 6 workers, and memory-heavy pdfplumber thrashes beyond 4. pypdf
+# scales with CPU count (up to MAX_WORKERS_CAP).
+PARSER_WORKER_CAPS = {
+    "pymupdf": 6,
+    "pdfplumber": 4,
+}
+COMBINED_METADATA_FILENAME = "all_metadata.csv"
+COMBINED_TRANSACTIONS_FILENAME = "all_transactions.csv"
+COMBINED_RESULTS_FILENAME = "all_results.ndjson"
+CSV_WRITE_BUFFER_SIZE = 1 << 20  # 1 MiB
+# PDF header signature; readers accept it anywhere in the first 1 KiB
+PDF_MAGIC = b"%PDF-"
+PDF_HEADER_SEARCH_BYTES = 1024
+VALID_INIT_STRATEGIES = frozenset(["per-file", "per-worker"])
+VALID_OUTPUT_FORMATS = frozenset(["csv", "ndjson"])
+
+# Parsers whose native backend releases the GIL and is safe to drive from
+# multiple threads, so batches can use a thread pool and skip process startup
+# and result pickling. They behave as I/O-bound to the scheduler and are
+# sized by MAX_THREAD_WORKERS_CAP instead of the process-pool caps.
+# PyMuPDF is deliberately excluded: its documentation states it does not
+# support multithreaded use, even with separate documents per thread.
+THREADED_PARSERS = frozenset(["pdfoxide"])
+
+# Modules a forkserver imports once for all its workers (WORKER_START_METHOD)
+_FORKSERVER_PRELOAD = ["pdfparser.utils"] + sorted(
+    {module for module, _ in PARSER_BACKENDS.values()}
+)
+
+# Per-worker parser state, set once by _init_worker()
+_WORKER_PARSER_NAME: Optional[str] = None
+_WORKER_PARSER_FUNC: Optional[Callable[..., Dict[str, Any]]] = None
+_WORKER_INIT_STRATEGY = DEFAULT_INIT_STRATEGY
+_WORKER_RECYCLED = False
+_WORKER_OUTPUT_DIRS: Optional[Tuple[str, str]] = None
+_WORKER_OUTPUT_DIR_FDS: Optional[Tuple[int, int]] = None
 
 
 @dataclass
@@ -88,18 +140,27 @@ def get_optimal_workers(parser_name: str = "pymupdf") -> int:
     """
     Calculate optimal worker count based on system resources.
 
-    Returns the recommended number of worker processes for batch processing,
-    capped at MAX_WORKERS_CAP to prevent resource exhaustion.
+    Returns the recommended number of workers for batch processing.
+    GIL-bound parsers run in processes, capped per parser (see
+    PARSER_WORKER_CAPS) and at MAX_WORKERS_CAP to prevent resource
+    exhaustion; parsers in THREADED_PARSERS run in threads and scale with
+    the CPU count up to MAX_THREAD_WORKERS_CAP.
 
     Args:
         parser_name: Parser backend (affects scaling strategy)
 
     Returns:
-        Recommended worker count (4-16 range)
+        Recommended worker count (1-16 range, up to 32 for threaded parsers)
     """
     cpu_count = os.cpu_count() or 4
-    # Cap at 16 workers to prevent resource exhaustion
-    return min(cpu_count, MAX_WORKERS_CAP)
+    return min(cpu_count, PARSER_WORKER_CAPS.get(parser_name, _worker_cap(parser_name)))
+
+
+def _worker_cap(parser_name: str) -> int:
+    """Return the hard worker limit for a parser's pool type."""
+    if parser_name in THREADED_PARSERS:
+        return MAX_THREAD_WORKERS_CAP
+    return MAX_WORKERS_CAP
 
 
 def get_worker_config(
@@ -112,7 +173,8 @@ def get_worker_config(
 
     Args:
         parser_name: Parser backend
-        max_workers: Override auto-detection (will be capped at MAX_WORKERS_CAP)
+        max_workers: Override auto-detection (capped at MAX_WORKERS_CAP, or
+            MAX_THREAD_WORKERS_CAP for threaded parsers)
         init_strategy: Parser initialization strategy ('per-file' or 'per-worker')
 
     Returns:
@@ -121,7 +183,7 @@ def get_worker_config(
     if max_workers is None:
         max_workers = get_optimal_workers(parser_name)
     else:
-        max_workers = min(max_workers, MAX_WORKERS_CAP)
+        max_workers = min(max_workers, _worker_cap(parser_name))
 
     return WorkerConfig(
         parser_name=parser_name,
@@ -131,12 +193,48 @@ def get_worker_config(
     )
 
 
+def _init_worker(
+    parser_name: str,
+    init_strategy: str = DEFAULT_INIT_STRATEGY,
+    recycled: bool = False,
+    output_dirs: Optional[Tuple[str, str]] = None,
+) -> None:
+    """
+    Initialize a worker process by importing its parser backend once.
+
+    Only the selected backend is imported, and the resolved parser function
+    is cached in a process global, along with the batch settings, so pool
+    tasks can be bare file paths. Import errors are left for the tasks to
+    report (an exception here would make the pool keep respawning workers).
+
+    Args:
+        parser_name: Parser backend used by this batch
+        init_strategy: Parser initialization strategy of this batch
+        recycled: The pool replaces this worker after each task (max_tasks_per_child)
+        output_dirs: (metadata_dir, transactions_dir) for workers that write their
+            own per-file CSVs, or None to return full results to the driver
+    """
+    global _WORKER_PARSER_NAME, _WORKER_PARSER_FUNC, _WORKER_INIT_STRATEGY
+    global _WORKER_RECYCLED, _WORKER_OUTPUT_DIRS, _WORKER_OUTPUT_DIR_FDS
+    _WORKER_PARSER_NAME = parser_name
+    _WORKER_INIT_STRATEGY = init_strategy
+    _WORKER_RECYCLED = recycled
+    _WORKER_OUTPUT_DIRS = output_dirs
+    # Closed when the worker process exits
+    _WORKER_OUTPUT_DIR_FDS = _open_dir_fds(output_dirs) if output_dirs else None
+    try:
+        _WORKER_PARSER_FUNC = get_parser_func(parser_name)
+    except (ImportError, ValueError):
+        pass
+
+
 def process_single_file(args: tuple) -> Dict[str, Any]:
     """
     Process a single PDF file and return parsed results.
 
     This function is designed to be called by ProcessPoolExecutor
-    for parallel processing. It is multiprocessing-safe with no global state.
+    for parallel processing. It is multiprocessing-safe; the only global
+    state it reads is the per-worker parser cached by _init_worker().
 
     Args:
         args: Tuple of (file_path, parser_name, init_strategy)
@@ -146,17 +244,119 @@ def process_single_file(args: tuple) -> Dict[str, Any]:
             - success: Whether parsing succeeded
             - file_path: Original file path
             - file_name: Base filename
+            - base_name: Filename without extension, used to name output CSVs
             - metadata: Extracted metadata dict (empty if failed)
             - transactions: Extracted transactions list (empty if failed)
             - error: Error message if parsing failed
             - is_valid: Whether validation passed
     """
     file_path, parser_name, init_strategy = args
+    return _process_file(file_path, parser_name, init_strategy)
+
+
+def _process_worker_task(file_path: str) -> Dict[str, Any]:
+    """
+    Pool task: process one file with the batch settings stored by _init_worker().
+
+    Shipping bare paths instead of (path, parser, strategy) tuples keeps the
+    pickled payload per task small.
+    """
+    return _process_file(
+        file_path,
+        _WORKER_PARSER_NAME or "",
+        _WORKER_INIT_STRATEGY,
+        _WORKER_OUTPUT_DIRS,
+        _WORKER_OUTPUT_DIR_FDS,
+    )
+
+
+def _open_dir_fds(dirs: Tuple[str, str]) -> Optional[Tuple[int, int]]:
+    """
+    Open (metadata_dir, transactions_dir) as directory descriptors.
+
+    Returns None where os.open() has no dir_fd support (e.g. Windows) or
+    the directories cannot be opened; callers then fall back to full paths.
+    """
+    if os.open not in os.supports_dir_fd or not hasattr(os, "O_DIRECTORY"):
+        return None
+    flags = os.O_RDONLY | os.O_DIRECTORY
+    try:
+        metadata_fd = os.open(dirs[0], flags)
+    except OSError:
+        return None
+    try:
+        transactions_fd = os.open(dirs[1], flags)
+    except OSError:
+        os.close(metadata_fd)
+        return None
+    return metadata_fd, transactions_fd
+
+
+def _process_file(
+    file_path: str,
+    parser_name: str,
+    init_strategy: str,
+    output_dirs: Optional[Tuple[str, str]] = None,
+    dir_fds: Optional[Tuple[int, int]] = None,
+    parser_func: Optional[Callable[..., Dict[str, Any]]] = None,
+    threaded: bool = False,
+) -> Dict[str, Any]:
+    """
+    Parse one file for process_single_file() and the batch pool tasks.
+
+    With output_dirs, the per-file CSVs are written here, in the worker, and
+    the returned result is a status-only dict (metadata and transactions are
+    dropped) so no parsed data has to be sent back to the driver. Thread
+    pool tasks pass parser_func; process workers use the one cached by
+    _init_worker().
+    """
+    # Use the parser function cached by _init_worker, if any
+    if parser_func is None and parser_name == _WORKER_PARSER_NAME:
+        parser_func = _WORKER_PARSER_FUNC
+    result = _parse_file(file_path, parser_name, parser_func)
+
+    if output_dirs is not None:
+        if result["success"]:
+            metadata_dir, transactions_dir = output_dirs
+            try:
+                save_result_files(result, "", metadata_dir, transactions_dir, dir_fds)
+            except Exception as e:  # pylint: disable=broad-except
+                result["success"] = False
+                result["error"] = f"Failed to save results: {e}"
+        del result["metadata"], result["transactions"]
+
+    # per-file: drop parser garbage in the worker, unless the pool already
+    # replaces the worker process after every file. Thread tasks skip it: a
+    # collection there pauses every thread in the driver process
+    if init_strategy == "per-file" and not _WORKER_RECYCLED and not threaded:
+        gc.collect()
+
+    return result
+
+
+def _parse_file(
+    file_path: str,
+    parser_name: str,
+    parser_func: Optional[Callable[..., Dict[str, Any]]],
+) -> Dict[str, Any]:
+    """
+    Parse one file into a result dict (see process_single_file()).
+
+    Args:
+        file_path: Path to the PDF file
+        parser_name: Parser backend name, resolved if parser_func is None
+        parser_func: Parser function to call instead of the registered backend
+
+    Returns:
+        Result dict as documented in process_single_file()
+    """
+    file_name = os.path.basename(file_path)
 
     result = {
         "success": False,
         "file_path": file_path,
-        "file_name": os.path.basename(file_path),
+        "file_name": file_name,
+        "base_name": os.path.splitext(file_name)[0],
         "metadata": {},
         "transactions": [],
         "error": None,
@@ -164,13 +364,20 @@ def process_single_file(args: tuple) -> Dict[str, Any]:
     }
 
     try:
-        # Get the parser function
-        parser_func = PARSERS.get(parser_name)
+        # Reject empty and non-PDF files before paying for a full parse
+        with open(file_path, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                result["error"] = f"Empty file: {file_path}"
+                return result
+            if PDF_MAGIC not in f.read(PDF_HEADER_SEARCH_BYTES):
+                result["error"] = f"Not a PDF: {file_path}"
+                return result
+
         if parser_func is None:
-            raise ValueError(f"Unknown parser: {parser_name}")
+            parser_func = get_parser_func(parser_name)
 
-        # Parse the PDF
-        parse_result = parser_func(file_path)
+        # Parse the PDF (batch never verifies turnover, so skip full_text)
+        parse_result = parser_func(file_path, need_full_text=False)
 
         metadata = parse_result.get("metadata", {})
         transactions = parse_result.get("transactions", [])
@@ -184,6 +391,8 @@ def process_single_file(args: tuple) -> Dict[str, Any]:
         result["error"] = f"File not found: {file_path}"
     except PermissionError:
         result["error"] = f"Permission denied: {file_path}"
+    except ValueError as e:
+        result["error"] = str(e)
     except Exception as e:  # pylint: disable=broad-except
         result["error"] = str(e)
 
@@ -195,6 +404,7 @@ def save_result_files(
     output_dir: str,
     metadata_dir: str,
     transactions_dir: str,
+    dir_fds: Optional[Tuple[int, int]] = None,
 ) -> None:
     """
     Save parsed results to CSV files.
@@ -204,19 +414,146 @@ def save_result_files(
         output_dir: Base output directory
         metadata_dir: Subdirectory for metadata CSVs
         transactions_dir: Subdirectory for transaction CSVs
+        dir_fds: Open (metadata_dir, transactions_dir) descriptors; files are then
+            created relative to them instead of by full path
     """
-    file_name = result["file_name"]
-    base_name = os.path.splitext(file_name)[0]
+    base_name = result.get("base_name") or os.path.splitext(result["file_name"])[0]
+    metadata_name = f"{base_name}_metadata.csv"
+    transactions_name = f"{base_name}_transactions.csv"
 
     # Save metadata CSV
     if result["metadata"]:
-        metadata_path = os.path.join(metadata_dir, f"{base_name}_metadata.csv")
-        save_metadata_csv(result["metadata"], metadata_path)
+        if dir_fds is not None:
+            save_metadata_csv(result["metadata"], metadata_name, dir_fd=dir_fds[0])
+        else:
+            save_metadata_csv(result["metadata"], os.path.join(metadata_dir, metadata_name))
 
     # Save transactions CSV
     if result["transactions"]:
-        transactions_path = os.path.join(transactions_dir, f"{base_name}_transactions.csv")
-        save_transactions_csv(result["transactions"], transactions_path)
+        if dir_fds is not None:
+            save_transactions_csv(result["transactions"], transactions_name, dir_fd=dir_fds[1])
+        else:
+            save_transactions_csv(
+                result["transactions"], os.path.join(transactions_dir, transactions_name)
+            )
+
+
+class CombinedCsvWriter:
+    """
+    Append metadata and transactions from many PDFs to two shared CSV files.
+
+    Used instead of save_result_files() when batch_parse() runs with
+    split_outputs=False: one open handle and one csv writer per output
+    replace two file creations per input PDF. Each row carries the source
+    file name. Not thread-safe; batch_parse() drives it from its single
+    I/O thread.
+
+    Args:
+        output_dir: Directory for all_metadata.csv and all_transactions.csv
+    """
+
+    def __init__(self, output_dir: str):
+        self._metadata_file = open(
+            os.path.join(output_dir, COMBINED_METADATA_FILENAME),
+            "w",
+            newline="",
+            encoding="utf-8",
+            buffering=CSV_WRITE_BUFFER_SIZE,
+        )
+        self._transactions_file = open(
+            os.path.join(output_dir, COMBINED_TRANSACTIONS_FILENAME),
+            "w",
+            newline="",
+            encoding="utf-8",
+            buffering=CSV_WRITE_BUFFER_SIZE,
+        )
+        self._metadata_writer = csv.writer(self._metadata_file, delimiter=";")
+        self._transactions_writer = csv.writer(self._transactions_file, delimiter=";")
+        self._metadata_writer.writerow(["File", "Field", "Value"])
+        self._transactions_writer.writerow(
+            ["File", "Date", "Description", "User", "Debit", "Credit", "Balance"]
+        )
+
+    def write_result(self, result: Dict[str, Any]) -> None:
+        """
+        Append one parsed result's metadata and transaction rows.
+
+        Args:
+            result: Parsed result dict from process_single_file()
+        """
+        file_name = result["file_name"]
+
+        self._metadata_writer.writerows(
+            [file_name, field_name, _format_number_for_csv(value) if value else ""]
+            for field_name, value in result["metadata"].items()
+        )
+        self._transactions_writer.writerows(
+            [
+                file_name,
+                txn.get("date", ""),
+                txn.get("description", ""),
+                txn.get("user", ""),
+                _format_number_for_csv(txn.get("debit", "")),
+                _format_number_for_csv(txn.get("credit", "")),
+                _format_number_for_csv(txn.get("balance", "")),
+            ]
+            for txn in result["transactions"]
+        )
+
+    def close(self) -> None:
+        """Flush and close both output files."""
+        self._metadata_file.close()
+        self._transactions_file.close()
+
+
+def _dumps_json(obj: Any) -> bytes:
+    """Serialize obj to UTF-8 JSON bytes, with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+class NdjsonWriter:
+    """
+    Append every parsed result to one newline-delimited JSON file.
+
+    Used when batch_parse() runs with output_format="ndjson": one JSON
+    object per PDF (file_name, file_path, is_valid, metadata, transactions)
+    with values kept exactly as parsed, so downstream Python consumers skip
+    CSV number formatting and re-parsing. Uses orjson if available, stdlib
+    json otherwise. Not thread-safe; batch_parse() drives it from its single
+    I/O thread.
+
+    Args:
+        output_dir: Directory for all_results.ndjson
+    """
+
+    def __init__(self, output_dir: str):
+        self._file = open(
+            os.path.join(output_dir, COMBINED_RESULTS_FILENAME),
+            "wb",
+            buffering=CSV_WRITE_BUFFER_SIZE,
+        )
+
+    def write_result(self, result: Dict[str, Any]) -> None:
+        """
+        Append one parsed result as a JSON line.
+
+        Args:
+            result: Parsed result dict from process_single_file()
+        """
+        record = {
+            "file_name": result["file_name"],
+            "file_path": result["file_path"],
+            "is_valid": result["is_valid"],
+            "metadata": result["metadata"],
+            "transactions": result["transactions"],
+        }
+        self._file.write(_dumps_json(record) + b"\n")
+
+    def close(self) -> None:
+        """Flush and close the output file."""
+        self._file.close()
 
 
 def validate_batch_params(
@@ -224,6 +561,7 @@ def validate_batch_params(
     max_workers: Optional[int],
     chunk_size: int,
     init_strategy: str,
+    output_format: str = "csv",
 ) -> None:
     """
     Validate batch processing parameters.
@@ -233,12 +571,15 @@ def validate_batch_params(
         max_workers: Worker count override
         chunk_size: Files per worker batch
         init_strategy: Parser initialization strategy
+        output_format: Output file format ('csv' or 'ndjson')
 
     Raises:
         ValueError: If any parameter is invalid
     """
     if parser_name not in VALID_PARSERS:
-        raise ValueError(f"Invalid parser: {parser_name}. Choose from: {', '.join(VALID_PARSERS)}")
+        raise ValueError(
+            f"Invalid parser: {parser_name}. Choose from: {', '.join(PARSER_BACKENDS)}"
+        )
 
     if max_workers is not None:
         if not isinstance(max_workers, int) or max_workers < 1 or max_workers > 32:
@@ -250,59 +591,457 @@ def validate_batch_params(
     if init_strategy not in VALID_INIT_STRATEGIES:
         raise ValueError(f"init_strategy must be 'per-file' or 'per-worker', got: {init_strategy}")
 
+    if output_format not in VALID_OUTPUT_FORMATS:
+        raise ValueError(f"output_format must be 'csv' or 'ndjson', got: {output_format}")
 
-def batch_parse(
+
+def _filter_valid_paths(paths: Iterable[str]) -> Tuple[List[str], int]:
+    """
+    Keep the paths that point at existing files, logging a warning for the rest.
+
+    The valid paths are ordered largest file first (longest-processing-time
+    first), so big PDFs start early instead of leaving one worker busy with
+    them at the end of the batch while the others idle. Files of equal size
+    keep their input order.
+
+    Args:
+        paths: Input paths (any iterable, consumed once)
+
+    Returns:
+        Tuple of (valid paths, number of input paths)
+    """
+    # One stat per path, reused for the size ordering; paths are kept as
+    # the strings the caller passed
+    sizes: Dict[str, int] = {}
+    valid_paths: List[str] = []
+    input_count = 0
+    for path in paths:
+        input_count += 1
+        try:
+            st = os.stat(path)
+        except OSError:
+            logger.warning("File not found, skipping: %s", path)
+            continue
+        if not stat.S_ISREG(st.st_mode):
+            logger.warning("Not a file, skipping: %s", path)
+            continue
+        valid_paths.append(path)
+        sizes[path] = st.st_size
+    valid_paths.sort(key=sizes.__getitem__, reverse=True)
+    return valid_paths, input_count
+
+
+def _process_pool_context() -> Any:
+    """
+    Pick the multiprocessing context for a batch process pool.
+
+    Uses the start method named by WORKER_START_METHOD (see load_config()),
+    or the platform default when it is unset. With forkserver, each worker is
+    forked from a small server process that has already imported utils and
+    the parser backends, instead of booting a fresh interpreter (spawn, which
+    Python also uses for max_tasks_per_child) or copying the whole parent
+    (fork); scripts must then guard their entry point with
+    if __name__ == "__main__".
+
+    Returns:
+        A multiprocessing context, or None for the platform default
+
+    Raises:
+        ValueError: If WORKER_START_METHOD names an unavailable start method
+    """
+    start_method = load_config().get("worker_start_method")
+    if not start_method:
+        return None
+    ctx = multiprocessing.get_context(start_method)
+    if start_method == "forkserver":
+        # The preload list is process-wide and only read when the server
+        # starts, so it covers every backend rather than the first batch's;
+        # missing backends are skipped
+        ctx.set_forkserver_preload(_FORKSERVER_PRELOAD)
+    return ctx
+
+
+def _long_documents(
+    parser_name: str, paths: List[str], max_workers: int
+) -> Tuple[List[str], Optional[Callable[..., Dict[str, Any]]]]:
+    """
+    Find the PDFs in a small batch that are worth splitting across page workers.
+
+    With fewer than max_workers // 2 files, file-level parallelism leaves most
+    workers idle while each long statement is parsed on one core. PyMuPDF can
+    instead split a document's pages across the batch's worker processes, and
+    pdf_oxide across its worker threads. Only documents of at least the
+    backend's PAGE_PARALLEL_MIN_PAGES are split; the rest stay file-level
+    tasks. Page counts are only read for small batches, so large batches never
+    pay for the extra open.
+
+    Args:
+        parser_name: Parser backend name
+        paths: Files in the batch
+        max_workers: Worker count for the batch
+
+    Returns:
+        Tuple of (paths to split, page-parallel parser taking an executor=
+        keyword); ([], None) when nothing is split
+    """
+    if len(paths) >= max_workers // 2:
+        return [], None
+    try:
+        if parser_name == "pymupdf":
+            from pdfparser.pymupdf_parser import PAGE_PARALLEL_MIN_PAGES as min_pages
+            from pdfparser.pymupdf_parser import get_page_count
+            from pdfparser.pymupdf_parser import parse_pdf_pymupdf_parallel as parse_parallel
+        elif parser_name == "pdfoxide":
+            from pdfparser.pdfoxide_parser import PAGE_PARALLEL_MIN_PAGES as min_pages
+            from pdfparser.pdfoxide_parser import get_page_count
+            from pdfparser.pdfoxide_parser import parse_pdf_pdfoxide_parallel as parse_parallel
+        else:
+            return [], None
+    except ImportError:
+        return [], None
+
+    long_paths = []
+    for path in paths:
+        try:
+            if get_page_count(path) >= min_pages:
+                long_paths.append(path)
+        except Exception:  # pylint: disable=broad-except
+            # Unreadable files stay file-level tasks, which report the error
+            continue
+    if not long_paths:
+        return [], None
+    return long_paths, partial(parse_parallel, max_workers=max_workers)
+
+
+def _iter_split_results(
+    executor: Executor,
+    task_func: Callable[[str], Dict[str, Any]],
     paths: List[str],
+    long_paths: List[str],
+    page_parser: Callable[..., Dict[str, Any]],
+    parser_name: str,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Yield results in paths order, parsing long_paths page-parallel in the driver.
+
+    Every other file is queued on the pool up front as a regular file task,
+    so the pool stays busy while the driver splits each long document's pages
+    across the remaining workers.
+    """
+    split = set(long_paths)
+    file_results = executor.map(task_func, [path for path in paths if path not in split])
+    for path in paths:
+        if path in split:
+            yield _parse_file(path, parser_name, page_parser)
+        else:
+            yield next(file_results)
+
+
+def _iter_batch_results(
+    valid_paths: List[str],
+    parser_name: str,
+    max_workers: Optional[int],
+    output_dir: str,
+    chunk_size: int,
+    init_strategy: str,
+    split_outputs: bool,
+    output_format: str,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Parse valid_paths in parallel and yield each result once its CSVs are saved.
+
+    Results are yielded in valid_paths order. A result whose CSV write failed is
+    yielded with success=False, so callers can count outcomes as they go.
+    """
+    # Create output subdirectories
+    metadata_dir = os.path.join(output_dir, "metadata")
+    transactions_dir = os.path.join(output_dir, "transactions")
+    os.makedirs(metadata_dir, exist_ok=True)
+    os.makedirs(transactions_dir, exist_ok=True)
+
+    # Determine worker count
+    if max_workers is None:
+        max_workers = get_optimal_workers(parser_name)
+    else:
+        max_workers = min(max_workers, _worker_cap(parser_name))
+
+    combined_writer: Optional[Any] = None
+    if output_format == "ndjson":
+        combined_writer = NdjsonWriter(output_dir)
+    elif not split_outputs:
+        combined_writer = CombinedCsvWriter(output_dir)
+
+    # In a batch too small to fill the pool, long PDFs are parsed from the
+    # driver with their pages split across the same pool's workers
+    long_paths, page_parser = _long_documents(parser_name, valid_paths, max_workers)
+
+    # Per-file CSVs are written by the pool workers themselves, in parallel,
+    # and only a status dict comes back; shared combined files (and split
+    # documents, parsed in the driver) are written from the driver's I/O thread
+    worker_dirs: Optional[Tuple[str, str]] = None
+    if combined_writer is None:
+        worker_dirs = (metadata_dir, transactions_dir)
+
+    # Thread pool for thread-safe native backends, process pool otherwise
+    executor: Executor
+    task_func: Callable[[str], Dict[str, Any]] = _process_worker_task
+    thread_dir_fds: Optional[Tuple[int, int]] = None
+    if parser_name in THREADED_PARSERS:
+        # Threads share this process's globals, so _init_worker() (which
+        # writes them) is for process workers only; threads get the parser
+        # function and batch settings bound into the task instead. Import
+        # errors are left for the tasks to report, as in _init_worker()
+        try:
+            thread_parser_func: Optional[Callable[..., Dict[str, Any]]] = get_parser_func(
+                parser_name
+            )
+        except (ImportError, ValueError):
+            thread_parser_func = None
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        thread_dir_fds = _open_dir_fds(worker_dirs) if worker_dirs else None
+        task_func = partial(
+            _process_file,
+            parser_name=parser_name,
+            init_strategy=init_strategy,
+            output_dirs=worker_dirs,
+            dir_fds=thread_dir_fds,
+            parser_func=thread_parser_func,
+            threaded=True,
+        )
+    else:
+        # per-file on Python 3.11+: replace each worker after one file so the
+        # backend's native heap goes back to the OS with the process
+        recycle = init_strategy == "per-file" and sys.version_info >= (3, 11)
+        pool_kwargs: Dict[str, Any] = {"max_tasks_per_child": 1} if recycle else {}
+        executor = ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=_init_worker,
+            initargs=(parser_name, init_strategy, recycle, worker_dirs),
+            mp_context=_process_pool_context(),
+            **pool_kwargs,
+        )
+
+    # Driver-side writes run on a dedicated I/O thread so collecting results
+    # never blocks on disk; a result is held only until its save finishes
+    io_pool = ThreadPoolExecutor(max_workers=1)
+    pending: Deque[Tuple[Optional[Future], Dict[str, Any]]] = deque()
+
+    # Bind the save callable once instead of rebuilding its arguments per result
+    save: Callable[[Dict[str, Any]], None]
+    if combined_writer is not None:
+        save = combined_writer.write_result
+    else:
+        save = partial(
+            save_result_files,
+            output_dir=output_dir,
+            metadata_dir=metadata_dir,
+            transactions_dir=transactions_dir,
+        )
+
+    # Ship tasks to workers in chunks (capped by chunk_size) to amortize
+    # per-task IPC overhead; kept small (about 8 per worker) so idle workers
+    # pick up the remaining work sooner. Ignored by the thread pool
+    chunksize = max(1, min(chunk_size, len(valid_paths) // (max_workers * 8)))
+
+    def finish(save_future: Optional[Future], result: Dict[str, Any]) -> Dict[str, Any]:
+        # A failed save marks its file as failed
+        if save_future is not None:
+            save_error = save_future.exception()
+            if save_error is not None:
+                result["success"] = False
+                result["error"] = f"Failed to save results: {save_error}"
+        return result
+
+    def shutdown_executor(exc_type: Any, exc: Any, tb: Any) -> None:
+        # A caller that stops iterating early (GeneratorExit) or an error
+        # drops the queued files instead of parsing them all first. Thread
+        # tasks still running write through thread_dir_fds, so those are
+        # waited for before the fds close
+        abandoned = exc_type is not None
+        executor.shutdown(
+            wait=not abandoned or thread_dir_fds is not None,
+            cancel_futures=abandoned,
+        )
+
+    with contextlib.ExitStack() as stack:
+        # Unwound in reverse: pools shut down before the combined writer and
+        # the directory fds close, on every exit path
+        for fd in thread_dir_fds or ():
+            stack.callback(os.close, fd)
+        if combined_writer is not None:
+            stack.callback(combined_writer.close)
+        stack.push(shutdown_executor)
+        stack.enter_context(io_pool)
+
+        # Results come back in task order; _process_file turns parse
+        # errors into error results, so only a broken pool raises here
+        results_iter: Iterator[Dict[str, Any]]
+        if page_parser is None:
+            results_iter = executor.map(task_func, valid_paths, chunksize=chunksize)
+        else:
+            results_iter = _iter_split_results(
+                executor,
+                task_func,
+                valid_paths,
+                long_paths,
+                partial(page_parser, executor=executor),
+                parser_name,
+            )
+
+        completed = 0
+        try:
+            for result in results_iter:
+                completed += 1
+
+                save_future: Optional[Future] = None
+                if result["success"] and (worker_dirs is None or "metadata" in result):
+                    # Save result files for successful parses not already
+                    # written by a worker
+                    save_future = io_pool.submit(save, result)
+                pending.append((save_future, result))
+
+                # Hand back every result whose save has already finished
+                while pending and (pending[0][0] is None or pending[0][0].done()):
+                    yield finish(*pending.popleft())
+
+        except Exception as e:  # pylint: disable=broad-except
+            # Every task without a result is reported as failed
+            for path in valid_paths[completed:]:
+                pending.append(
+                    (
+                        None,
+                        {
+                            "success": False,
+                            "file_path": path,
+                            "file_name": os.path.basename(path),
+                            "error": str(e),
+                        },
+                    )
+                )
+
+        # Wait for pending CSV writes before yielding the remaining results
+        io_pool.shutdown(wait=True)
+        if combined_writer is not None:
+            combined_writer.close()
+        while pending:
+            yield finish(*pending.popleft())
+
+
+def batch_parse_iter(
+    paths: Iterable[str],
+    parser_name: str = "pymupdf",
+    max_workers: Optional[int] = None,
+    output_dir: Optional[str] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    init_strategy: str = DEFAULT_INIT_STRATEGY,
+    split_outputs: bool = True,
+    progress_callback: Optional[Callable[[Dict[str, Any]], None]] = None,
+    output_format: str = "csv",
+) -> Iterator[Dict[str, Any]]:
+    """
+    Parse multiple PDF files in parallel, yielding one result dict at a time.
+
+    Takes the same arguments as batch_parse, but never holds more than the
+    results still waiting on a CSV write, so memory stays flat for large
+    batches. Missing paths are skipped with a warning.
+
+    Args:
+        paths: Paths to PDF files to process (a list or any iterable)
+        parser_name: Parser to use ('pymupdf', 'pdfplumber', 'pypdf', 'pdfoxide')
+        max_workers: Maximum parallel workers (default: auto-detect CPU cores, capped at
+            16, or 32 for threaded parsers)
+        output_dir: Output directory for CSV files (default: from config)
+        chunk_size: Number of files per worker batch (default: 100)
+        init_strategy: Parser initialization strategy ('per-file' or 'per-worker', default: 'per-worker')
+        split_outputs: Write per-PDF CSVs (default: True) or two combined CSVs
+        progress_callback: Optional callable invoked with each result before it is yielded
+        output_format: 'csv' (default) or 'ndjson' for a single all_results.ndjson
+
+    Yields:
+        Per-file result dicts, largest file first (files of equal size keep
+        their input order). With per-file CSV output
+        (split_outputs=True, output_format='csv') they are status-only:
+        the workers write the CSVs and drop metadata/transactions.
+    """
+    validate_batch_params(parser_name, max_workers, chunk_size, init_strategy, output_format)
+
+    if output_dir is None:
+        output_dir = load_config().get("output_dir", "output")
+
+    valid_paths, _ = _filter_valid_paths(paths)
+    if not valid_paths:
+        return
+
+    for result in _iter_batch_results(
+        valid_paths,
+        parser_name,
+        max_workers,
+        output_dir,
+        chunk_size,
+        init_strategy,
+        split_outputs,
+        output_format,
+    ):
+        if progress_callback is not None:
+            progress_callback(result)
+        yield result
+
+
+def batch_parse(
+    paths: Iterable[str],
     parser_name: str = "pymupdf",
     max_workers: Optional[int] = None,
     output_dir: Optional[str] = None,
     verify_turnover: Optional[bool] = None,
     chunk_size: int = DEFAULT_CHUNK_SIZE,
     init_strategy: str = DEFAULT_INIT_STRATEGY,
+    split_outputs: bool = True,
+    collect_results: bool = True,
+    output_format: str = "csv",
 ) -> Dict[str, Any]:
     """
     Parse multiple PDF files in parallel and save results to CSV.
 
     This function processes PDF files using the specified parser,
     validates results, and saves metadata and transactions to
-    separate CSV files for each input file.
+    separate CSV files for each input file (or, with split_outputs=False,
+    to combined all_metadata.csv / all_transactions.csv files).
 
     Args:
-        paths: List of paths to PDF files to process
+        paths: Paths to PDF files to process (a list or any iterable, e.g. a generator)
         parser_name: Parser to use ('pymupdf', 'pdfplumber', 'pypdf', 'pdfoxide')
-        max_workers: Maximum parallel workers (default: auto-detect CPU cores, capped at 16)
+        max_workers: Maximum parallel workers (default: auto-detect CPU cores, capped at
+            16, or 32 for threaded parsers)
         output_dir: Output directory for CSV files (default: from config)
         verify_turnover: Enable turnover verification (default: from config)
         chunk_size: Number of files per worker batch (default: 100)
         init_strategy: Parser initialization strategy ('per-file' or 'per-worker', default: 'per-worker')
+        split_outputs: Write one metadata and one transactions CSV per PDF (default: True).
+            If False, append all rows to two combined CSVs in output_dir.
+        collect_results: Keep every per-file result in the returned dict (default: True).
+            Pass False for large batches to keep memory flat; "results" is then empty.
+            Use batch_parse_iter to consume results as they arrive.
+        output_format: 'csv' (default) or 'ndjson'. With 'ndjson', every result is
+            appended to a single all_results.ndjson in output_dir (split_outputs is
+            ignored); values are written as parsed, without CSV number formatting.
 
     Returns:
         Dict containing:
             - total: Total files processed
             - successful: Number of successfully parsed files
             - failed: Number of failed files
-            - results: List of individual file results
+            - results: List of individual file results (empty unless collect_results).
+              With per-file CSV output the workers write the CSVs themselves and
+              these are status-only (no metadata/transactions keys)
             - success_rate: Percentage of successful parses
             - duration: Total processing time in seconds
             - throughput: Files processed per second
             - memory_peak_mb: Peak memory usage (if available)
-            - worker_overhead_percent: Worker creation overhead percentage
+            - worker_overhead_percent: Share of the duration spent before the
+              first result arrived (pool startup, imports, parser init)
     """
     # Validate input parameters
-    validate_batch_params(parser_name, max_workers, chunk_size, init_strategy)
-
-    if not paths:
-        return {
-            "total": 0,
-            "successful": 0,
-            "failed": 0,
-            "results": [],
-            "success_rate": 0.0,
-            "duration": 0.0,
-            "throughput": 0.0,
-            "memory_peak_mb": 0.0,
-            "worker_overhead_percent": 0.0,
-        }
+    validate_batch_params(parser_name, max_workers, chunk_size, init_strategy, output_format)
 
     # Load configuration
     config = load_config()
@@ -311,29 +1050,14 @@ def batch_parse(
     if verify_turnover is None:
         verify_turnover = bool(config.get("verify_turnover", False))
 
-    # Create output subdirectories
-    metadata_dir = os.path.join(output_dir, "metadata")
-    transactions_dir = os.path.join(output_dir, "transactions")
-    os.makedirs(metadata_dir, exist_ok=True)
-    os.makedirs(transactions_dir, exist_ok=True)
-
     # Validate file paths
-    valid_paths = []
-    for path in paths:
-        path_obj = Path(path)
-        if not path_obj.exists():
-            print(f"Warning: File not found, skipping: {path}")
-            continue
-        if not path_obj.is_file():
-            print(f"Warning: Not a file, skipping: {path}")
-            continue
-        valid_paths.append(str(path_obj))
+    valid_paths, input_count = _filter_valid_paths(paths)
 
     if not valid_paths:
         return {
             "total": 0,
             "successful": 0,
-            "failed": len(paths),
+            "failed": input_count,
             "results": [],
             "success_rate": 0.0,
             "duration": 0.0,
@@ -342,60 +1066,38 @@ def batch_parse(
             "worker_overhead_percent": 0.0,
         }
 
-    # Prepare tasks for parallel execution
-    tasks = [(path, parser_name, init_strategy) for path in valid_paths]
+    # Track timing; the wait for the first result stands in for worker
+    # startup (pool creation, imports, parser init)
+    start_time = time.perf_counter()
+    worker_start_time: Optional[float] = None
 
-    # Determine worker count
-    if max_workers is None:
-        max_workers = get_optimal_workers(parser_name)
-    else:
-        max_workers = min(max_workers, MAX_WORKERS_CAP)
-
-    # Track timing
-    start_time = time.time()
-    worker_start_time = start_time
-
-    # Process files in parallel
+    # Process files in parallel, counting results as they stream in
     results = []
     successful = 0
     failed = 0
     memory_peak = 0.0
 
-    with ProcessPoolExecutor(max_workers=max_workers) as executor:
-        # Submit all tasks
-        futures = {executor.submit(process_single_file, task): task for task in tasks}
-
-        # Collect results as they complete
-        for future in as_completed(futures):
-            try:
-                result = future.result()
-                results.append(result)
-
-                if result["success"]:
-                    successful += 1
-                    # Save result files for successful parses
-                    save_result_files(result, output_dir, metadata_dir, transactions_dir)
-                else:
-                    failed += 1
-
-                # Trigger garbage collection for memory management
-                if init_strategy == "per-file":
-                    gc.collect()
-
-            except Exception as e:  # pylint: disable=broad-except
-                task = futures[future]
-                error_result = {
-                    "success": False,
-                    "file_path": task[0],
-                    "file_name": os.path.basename(task[0]),
-                    "error": str(e),
-                }
-                results.append(error_result)
-                failed += 1
-
-    end_time = time.time()
+    for result in _iter_batch_results(
+        valid_paths,
+        parser_name,
+        max_workers,
+        output_dir,
+        chunk_size,
+        init_strategy,
+        split_outputs,
+        output_format,
+    ):
+        if worker_start_time is None:
+            worker_start_time = time.perf_counter()
+        success = result["success"]
+        successful += success
+        failed += not success
+        if collect_results:
+            results.append(result)
+
+    end_time = time.perf_counter()
     duration = end_time - start_time
-    worker_overhead_time = worker_start_time - start_time
+    worker_overhead_time = (worker_start_time or end_time) - start_time
     worker_overhead_percent = (worker_overhead_time / duration * 100) if duration > 0 else 0.0
 
     total = len(valid_paths)
@@ -414,6 +1116,35 @@ def batch_parse(
     }
 
 
+def _iter_pdf_files(directory: str) -> Iterator[str]:
+    """
+    Lazily yield PDF file paths under a directory and its subdirectories.
+
+    Uses an iterative os.scandir traversal; DirEntry type information is
+    cached from the directory listing, so no per-entry stat is needed.
+    Symlinked directories are not followed (matching os.walk defaults).
+
+    Args:
+        directory: Directory to search
+
+    Yields:
+        Paths to files with a .pdf extension (case-insensitive)
+    """
+    stack = [directory]
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.name[-4:].lower() == ".pdf":
+                        yield entry.path
+        except OSError:
+            # Unreadable or vanished directory; skip it like os.walk does
+            continue
+
+
 def batch_parse_from_directory(
     directory: str,
     parser_name: str = "pymupdf",
@@ -422,6 +1153,8 @@ def batch_parse_from_directory(
     pattern: str = "**/*.pdf",
     chunk_size: int = DEFAULT_CHUNK_SIZE,
     init_strategy: str = DEFAULT_INIT_STRATEGY,
+    split_outputs: bool = True,
+    output_format: str = "csv",
 ) -> Dict[str, Any]:
     """
     Parse all PDF files in a directory and its subdirectories.
@@ -434,42 +1167,25 @@ def batch_parse_from_directory(
         parser_name: Parser to use
         max_workers: Maximum parallel workers
         output_dir: Output directory for CSV files
-        pattern: Glob pattern for file discovery (default: '**/*.pdf')
+        pattern: Deprecated and ignored; every file with a .pdf extension
+            (case-insensitive) under directory is parsed
         chunk_size: Number of files per worker batch (default: 100)
         init_strategy: Parser initialization strategy (default: 'per-worker')
+        split_outputs: Write per-PDF CSVs (default: True) instead of combined CSVs
+        output_format: 'csv' (default) or 'ndjson'
 
     Returns:
         Dict with batch processing results (same as batch_parse)
     """
-    # Discover PDF files
-    pdf_files = []
-    for root, _, files in os.walk(directory):
-        for file in files:
-            if file.lower().endswith(".pdf"):
-                pdf_files.append(os.path.join(root, file))
-
-    if not pdf_files:
-        return {
-            "total": 0,
-            "successful": 0,
-            "failed": 0,
-            "results": [],
-            "success_rate": 0.0,
-            "duration": 0.0,
-            "throughput": 0.0,
-            "memory_peak_mb": 0.0,
-            "worker_overhead_percent": 0.0,
-        }
-
-    # Sort for consistent ordering
-    pdf_files = sorted(pdf_files)
-
-    # Process files
+    # Discovery is lazy, but batch_parse's path validation consumes it whole:
+    # every file is stat'ed and sorted largest first before any is dispatched
     return batch_parse(
-        paths=pdf_files,
+        paths=_iter_pdf_files(directory),
         parser_name=parser_name,
         max_workers=max_workers,
         output_dir=output_dir,
         chunk_size=chunk_size,
         init_strategy=init_strategy,
+        split_outputs=split_outputs,
+        output_format=output_format,
     )
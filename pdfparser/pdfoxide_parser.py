@@ -5,15 +5,53 @@ This implementation uses the pdf_oxide library for text extraction.
 It is optimized for performance and multiprocessing safety.
 """
 
-from pathlib import Path
-from typing import Any, Dict
+import contextlib
+import os
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
 
 from pdf_oxide import PdfDocument
 
-from pdfparser.utils import extract_metadata, extract_summary_totals, extract_transactions
+from pdfparser.utils import build_parse_result, require_regular_file
 
+# Documents shorter than this are extracted on the calling thread; below it,
+# opening the PDF once per page worker costs more than it saves
+PAGE_PARALLEL_MIN_PAGES = 8
 
-def parse_pdf_pdfoxide(path: str) -> Dict[str, Any]:
+
+def get_page_count(path: str) -> int:
+    """
+    Count the pages of a PDF without extracting any text.
+
+    Args:
+        path: Path to PDF file (string or Path-like)
+
+    Returns:
+        Number of pages
+    """
+    return PdfDocument(str(path)).page_count()
+
+
+def _extract_page_range(path: str, start: int, stop: int) -> List[str]:
+    """
+    Extract the text of pages [start, stop) of a PDF on a worker thread.
+
+    Each worker opens its own PdfDocument rather than sharing one across
+    threads; pdf_oxide releases the GIL while it extracts.
+
+    Args:
+        path: Path to PDF file
+        start: First page index
+        stop: Page index to stop before
+
+    Returns:
+        Text of each page in the range (empty for pages without text)
+    """
+    doc = PdfDocument(path)
+    return [doc.extract_text(page_num) or "" for page_num in range(start, stop)]  # type: ignore[attr-defined]
+
+
+def parse_pdf_pdfoxide(path: str, need_full_text: bool = True) -> Dict[str, Any]:
     """
     Parse Indonesian bank statement PDF using pdf_oxide.
 
@@ -22,6 +60,8 @@ def parse_pdf_pdfoxide(path: str) -> Dict[str, Any]:
 
     Args:
         path: Path to PDF file (string or Path-like)
+        need_full_text: Include the concatenated page text under 'full_text'
+            (needed for turnover verification); skip it to keep the result small
 
     Returns:
         Dict with keys:
@@ -29,20 +69,59 @@ def parse_pdf_pdfoxide(path: str) -> Dict[str, Any]:
                          product_name, statement_date
             - 'transactions': List[Dict[str, str]] with date, description,
                              user, debit, credit, balance
+            - 'full_text': str with text of all pages (only if need_full_text)
 
     Raises:
         FileNotFoundError: If PDF file doesn't exist
         ValueError: If PDF is corrupted, invalid, or has no pages
         RuntimeError: For other PDF processing errors
     """
-    # Convert to Path for validation
-    path_obj = Path(path)
+    return _parse_pdf(path, need_full_text, max_workers=1)
+
+
+def parse_pdf_pdfoxide_parallel(
+    path: str,
+    max_workers: Optional[int] = None,
+    need_full_text: bool = True,
+    executor: Optional[Executor] = None,
+) -> Dict[str, Any]:
+    """
+    Parse a long statement PDF by extracting page ranges on parallel threads.
+
+    The page count is split into one contiguous range per worker thread and
+    the page texts are merged back in page order, so the result is identical
+    to parse_pdf_pdfoxide(). Documents shorter than PAGE_PARALLEL_MIN_PAGES
+    (or max_workers < 2) are extracted on the calling thread.
 
-    # Validate file existence
-    if not path_obj.exists():
-        raise FileNotFoundError(f"PDF file not found: {path}")
-    if not path_obj.is_file():
-        raise FileNotFoundError(f"Path is not a file: {path}")
+    Args:
+        path: Path to PDF file (string or Path-like)
+        max_workers: Maximum page worker threads (default: CPU count)
+        need_full_text: Include the concatenated page text under 'full_text'
+        executor: Thread pool to run the page ranges on, so callers parsing
+            many files reuse one pool; by default a pool is created per call
+
+    Returns:
+        Same as parse_pdf_pdfoxide()
+
+    Raises:
+        Same as parse_pdf_pdfoxide()
+    """
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    return _parse_pdf(path, need_full_text, max_workers, executor)
+
+
+def _parse_pdf(
+    path: str, need_full_text: bool, max_workers: int, executor: Optional[Executor] = None
+) -> Dict[str, Any]:
+    """
+    Parse a PDF, splitting long documents across up to max_workers threads.
+
+    The document is opened once here; short documents are extracted from
+    that handle, long ones by _extract_page_range() on page worker threads.
+    """
+    # Validate file existence (one stat call)
+    require_regular_file(path)
 
     try:
         # Open PDF document
@@ -53,38 +132,30 @@ def parse_pdf_pdfoxide(path: str) -> Dict[str, Any]:
         if page_count == 0:
             raise ValueError(f"PDF has no pages: {path}")
 
-        # Extract metadata from first page
-        header_text = doc.extract_text(0)  # type: ignore[attr-defined]
-        header_text = header_text or ""
-        metadata = extract_metadata(header_text)
-
-        # Fallback: extract account_no from filename if not found in text
-        if not metadata.get("account_no"):
-            import re
-
-            acct_match = re.search(r"(\d{10,16})", path_obj.stem)
-            if acct_match:
-                metadata["account_no"] = acct_match.group(1)
-
-        # Extract transactions from all pages
-        all_text = ""
-        for page_num in range(page_count):
-            page_text = doc.extract_text(page_num)  # type: ignore[attr-defined] or ""
-            all_text += page_text + "\n"
-        transactions = extract_transactions(all_text)
-
-        # Extract summary totals and add to metadata
-        summary = extract_summary_totals(all_text)
-        if summary.get("total_debit"):
-            metadata["total_debit"] = summary["total_debit"]
-        if summary.get("total_credit"):
-            metadata["total_credit"] = summary["total_credit"]
-        if summary.get("opening_balance"):
-            metadata["opening_balance"] = summary["opening_balance"]
-        if summary.get("closing_balance"):
-            metadata["closing_balance"] = summary["closing_balance"]
-
-        return {"metadata": metadata, "transactions": transactions, "full_text": all_text}
+        if page_count < PAGE_PARALLEL_MIN_PAGES or max_workers < 2:
+            # Extract the text of every page once; pdf_oxide may return None
+            # for pages without text
+            page_texts = [
+                doc.extract_text(page_num) or ""  # type: ignore[attr-defined]
+                for page_num in range(page_count)
+            ]
+        else:
+            step = -(-page_count // max_workers)  # ceil division
+            starts = range(0, page_count, step)
+            stops = [min(start + step, page_count) for start in starts]
+            with (
+                ThreadPoolExecutor(max_workers=len(starts))
+                if executor is None
+                else contextlib.nullcontext(executor)
+            ) as page_pool:
+                chunks = page_pool.map(
+                    _extract_page_range, [str(path)] * len(starts), starts, stops
+                )
+                page_texts = [text for chunk in chunks for text in chunk]
+
+        return build_parse_result(
+            path, page_texts[0], "\n".join(page_texts) + "\n", need_full_text
+        )
 
     except FileNotFoundError:
         raise
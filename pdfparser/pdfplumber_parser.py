@@ -8,26 +8,53 @@ Optimized for accuracy on tabular data and multiprocessing safety.
 
 import re
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Pattern
 
 import pdfplumber
 
 from pdfparser.utils import (
+    ACCOUNT_NO_FROM_FILENAME_PATTERN,
     TRANSACTION_DATE_PATTERN,
-    TRANSACTION_LINE_PATTERN,
     extract_metadata,
     extract_summary_totals,
     extract_transactions,
+    require_regular_file,
 )
 
-# Pattern to extract account number from filename
-ACCOUNT_NO_FROM_FILENAME_PATTERN = r"(\d{10,16})"
-
 # Alternative metadata patterns for Indonesian bank statement labels
-ACCOUNT_NO_PATTERN_ID = r"No\.\s*Rekening\s*:\s*([^\n]+)"
-BUSINESS_UNIT_PATTERN_ID = r"Unit\s*Kerja\s*:\s*([^\n]+)"
-PRODUCT_NAME_PATTERN_ID = r"Nama\s*Produk\s*:\s*([^\n]+)"
-STATEMENT_DATE_PATTERN_ID = r"Tanggal\s*Laporan\s*:\s*([^\n]+)"
+# (compiled once at import, with IGNORECASE baked in)
+ACCOUNT_NO_PATTERN_ID: Pattern = re.compile(r"No\.\s*Rekening\s*:\s*([^\n]+)", re.IGNORECASE)
+BUSINESS_UNIT_PATTERN_ID: Pattern = re.compile(r"Unit\s*Kerja\s*:\s*([^\n]+)", re.IGNORECASE)
+PRODUCT_NAME_PATTERN_ID: Pattern = re.compile(r"Nama\s*Produk\s*:\s*([^\n]+)", re.IGNORECASE)
+STATEMENT_DATE_PATTERN_ID: Pattern = re.compile(
+    r"Tanggal\s*Laporan\s*:\s*([^\n]+)", re.IGNORECASE
+)
+
+# Lines containing any of these are table headers/footers, not transactions
+INLINE_HEADER_MARKERS = (
+    "Tanggal Transaksi",
+    "Transaction Date",
+    "Uraian Transaksi",
+    "Transaction Description",
+    "Teller",
+    "User ID",
+    "Debet",
+    "Debit",
+    "Kredit",
+    "Credit",
+    "Saldo",
+    "Balance",
+    "Total Transaksi",
+    "Opening Balance",
+)
+
+# TRANSACTION_LINE_PATTERN applied to every line of a text at once: anchored
+# at line starts, skipping header lines, with whitespace kept within a line
+INLINE_TRANSACTION_PATTERN: Pattern = re.compile(
+    r"^(?![^\n]*(?:" + "|".join(map(re.escape, INLINE_HEADER_MARKERS)) + r"))[^\S\n]*"
+    r"(\d{2}/\d{2}/\d{2})[^\S\n]+(.+?)[^\S\n]+(\w+)[^\S\n]+([\d,.]+)?[^\S\n]+([\d,.]+)?[^\S\n]+([\d,.]+)",
+    re.MULTILINE,
+)
 
 
 def extract_metadata_pdfplumber(text: str) -> Dict[str, str]:
@@ -46,25 +73,25 @@ def extract_metadata_pdfplumber(text: str) -> Dict[str, str]:
     metadata = {}
 
     # Try Indonesian patterns first
-    account_match = re.search(ACCOUNT_NO_PATTERN_ID, text, re.IGNORECASE)
+    account_match = ACCOUNT_NO_PATTERN_ID.search(text)
     if account_match:
         metadata["account_no"] = account_match.group(1).strip()
     else:
         metadata["account_no"] = ""
 
-    business_match = re.search(BUSINESS_UNIT_PATTERN_ID, text, re.IGNORECASE)
+    business_match = BUSINESS_UNIT_PATTERN_ID.search(text)
     if business_match:
         metadata["business_unit"] = business_match.group(1).strip()
     else:
         metadata["business_unit"] = ""
 
-    product_match = re.search(PRODUCT_NAME_PATTERN_ID, text, re.IGNORECASE)
+    product_match = PRODUCT_NAME_PATTERN_ID.search(text)
     if product_match:
         metadata["product_name"] = product_match.group(1).strip()
     else:
         metadata["product_name"] = ""
 
-    date_match = re.search(STATEMENT_DATE_PATTERN_ID, text, re.IGNORECASE)
+    date_match = STATEMENT_DATE_PATTERN_ID.search(text)
     if date_match:
         metadata["statement_date"] = date_match.group(1).strip()
     else:
@@ -86,7 +113,8 @@ def extract_transactions_inline(text: str) -> List[Dict[str, str]]:
     """
     Extract transactions from inline text format (all fields on one line).
 
-    Uses TRANSACTION_LINE_PATTERN to parse transaction rows where:
+    Uses TRANSACTION_LINE_PATTERN (as INLINE_TRANSACTION_PATTERN, in one
+    pass over the whole text) to parse transaction rows where:
     - Date: DD/MM/YY HH:MM:SS
     - Description: free text (may contain spaces)
     - User: alphanumeric ID
@@ -101,43 +129,19 @@ def extract_transactions_inline(text: str) -> List[Dict[str, str]]:
         List of dicts with keys: date, description, user, debit, credit, balance
     """
     transactions = []
-    lines = text.split("\n")
-
-    for line in lines:
-        line = line.strip()
-        if not line:
-            continue
-
-        # Skip header lines
-        if "Tanggal Transaksi" in line or "Transaction Date" in line:
-            continue
-        if "Uraian Transaksi" in line or "Transaction Description" in line:
-            continue
-        if "Teller" in line or "User ID" in line:
-            continue
-        if "Debet" in line or "Debit" in line:
-            continue
-        if "Kredit" in line or "Credit" in line:
-            continue
-        if "Saldo" in line or "Balance" in line:
-            continue
-        if "Total Transaksi" in line or "Opening Balance" in line:
-            continue
-
-        # Try to match inline transaction pattern
-        match = re.match(TRANSACTION_LINE_PATTERN, line)
-        if match:
-            date, description, user, debit, credit, balance = match.groups()
-            transactions.append(
-                {
-                    "date": date.strip(),
-                    "description": description.strip(),
-                    "user": user.strip(),
-                    "debit": debit.strip() if debit else "",
-                    "credit": credit.strip() if credit else "",
-                    "balance": balance.strip(),
-                }
-            )
+    for date, description, user, debit, credit, balance in INLINE_TRANSACTION_PATTERN.findall(
+        text
+    ):
+        transactions.append(
+            {
+                "date": date,
+                "description": description.strip(),
+                "user": user,
+                "debit": debit,
+                "credit": credit,
+                "balance": balance,
+            }
+        )
 
     return transactions
 
@@ -152,6 +156,9 @@ def _parse_table_to_transactions(tables: List[List[List[str]]]) -> List[Dict[str
     Returns:
         List of transaction dicts
     """
+    # Cache the compiled date check for the row loop
+    _txn_date_match = TRANSACTION_DATE_PATTERN.match
+
     transactions = []
     for table in tables:
         if not table or len(table) < 2:  # Need header + at least 1 data row
@@ -159,26 +166,27 @@ def _parse_table_to_transactions(tables: List[List[List[str]]]) -> List[Dict[str
 
         # Skip header row (index 0), process data rows
         for row in table[1:]:
-            if len(row) >= 6:  # Ensure row has all columns
-                # Clean None values
-                row = [cell or "" for cell in row]
-
-                # Validate date format
-                if re.match(TRANSACTION_DATE_PATTERN, row[0]):
-                    transaction = {
-                        "date": row[0].strip(),
-                        "description": row[1].strip(),
-                        "user": row[2].strip(),
-                        "debit": row[3].strip(),
-                        "credit": row[4].strip(),
-                        "balance": row[5].strip(),
-                    }
-                    transactions.append(transaction)
+            # Ensure row has all columns and validate date format before
+            # cleaning the row, so non-transaction rows are rejected cheaply
+            if len(row) >= 6 and row[0] and _txn_date_match(row[0]):
+                # Clean None values and whitespace of the six used columns
+                date, description, user, debit, credit, balance = [
+                    (cell or "").strip() for cell in row[:6]
+                ]
+                transaction = {
+                    "date": date,
+                    "description": description,
+                    "user": user,
+                    "debit": debit,
+                    "credit": credit,
+                    "balance": balance,
+                }
+                transactions.append(transaction)
 
     return transactions
 
 
-def parse_pdf_pdfplumber(path: str) -> Dict[str, Any]:
+def parse_pdf_pdfplumber(path: str, need_full_text: bool = True) -> Dict[str, Any]:
     """
     Parse Indonesian bank statement PDF using pdfplumber.
 
@@ -188,6 +196,8 @@ def parse_pdf_pdfplumber(path: str) -> Dict[str, Any]:
 
     Args:
         path: Path to PDF file (string or Path-like)
+        need_full_text: Include the concatenated page text under 'full_text'
+            (needed for turnover verification); skip it to keep the result small
 
     Returns:
         Dict with keys:
@@ -195,18 +205,16 @@ def parse_pdf_pdfplumber(path: str) -> Dict[str, Any]:
                          product_name, statement_date
             - 'transactions': List[Dict[str, str]] with date, description,
                              user, debit, credit, balance
+            - 'full_text': str with text of all pages (only if need_full_text)
 
     Raises:
         FileNotFoundError: If PDF file doesn't exist
         pdfplumber.PDFSyntaxError: If PDF is corrupted or invalid
         Exception: For other PDF processing errors
     """
-    # Validate file existence
+    # Validate file existence (one stat call)
+    require_regular_file(path)
     path_obj = Path(path)
-    if not path_obj.exists():
-        raise FileNotFoundError(f"PDF file not found: {path}")
-    if not path_obj.is_file():
-        raise FileNotFoundError(f"Path is not a file: {path}")
 
     try:
         with pdfplumber.open(str(path)) as pdf:
@@ -214,30 +222,31 @@ def parse_pdf_pdfplumber(path: str) -> Dict[str, Any]:
             if len(pdf.pages) == 0:
                 raise ValueError(f"PDF has no pages: {path}")
 
+            # Try table extraction first, extracting each page's text once
+            transactions = []
+            all_tables = []
+            page_texts = []
+            for page in pdf.pages:
+                # The default table settings build cells from ruling lines
+                # only, so a page without line/rect/curve edges has no
+                # tables; skip the layout analysis for it
+                if page.edges:
+                    tables = page.extract_tables()
+                    if tables:
+                        all_tables.extend(tables)
+                # Also collect text for metadata and summary extraction
+                page_texts.append(page.extract_text() or "")
+            all_text = "\n".join(page_texts) + "\n"
+
             # Extract metadata using pdfplumber-specific patterns
-            first_page_text = pdf.pages[0].extract_text() or ""
-            metadata = extract_metadata_pdfplumber(first_page_text)
+            metadata = extract_metadata_pdfplumber(page_texts[0])
 
             # Fallback: extract account_no from filename if not found in text
             if not metadata.get("account_no"):
-                import re
-
-                acct_match = re.search(ACCOUNT_NO_FROM_FILENAME_PATTERN, path_obj.stem)
+                acct_match = ACCOUNT_NO_FROM_FILENAME_PATTERN.search(path_obj.stem)
                 if acct_match:
                     metadata["account_no"] = acct_match.group(1)
 
-            # Try table extraction first
-            transactions = []
-            all_tables = []
-            all_text = ""
-            for page in pdf.pages:
-                tables = page.extract_tables()
-                if tables:
-                    all_tables.extend(tables)
-                # Also collect text for summary extraction
-                page_text = page.extract_text() or ""
-                all_text += page_text + "\n"
-
             if all_tables:
                 transactions = _parse_table_to_transactions(all_tables)
 
@@ -260,7 +269,10 @@ def parse_pdf_pdfplumber(path: str) -> Dict[str, Any]:
             if summary.get("closing_balance"):
                 metadata["closing_balance"] = summary["closing_balance"]
 
-            return {"metadata": metadata, "transactions": transactions, "full_text": all_text}
+            result: Dict[str, Any] = {"metadata": metadata, "transactions": transactions}
+            if need_full_text:
+                result["full_text"] = all_text
+            return result
 
     except FileNotFoundError:
         raise
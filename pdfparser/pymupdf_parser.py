@@ -5,15 +5,21 @@ This implementation uses the PyMuPDF (fitz) library for fast text extraction.
 It is optimized for performance and multiprocessing safety.
 """
 
-from pathlib import Path
-from typing import Any, Dict
+import contextlib
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Any, Dict, Optional, Tuple
 
 import fitz  # PyMuPDF
 
-from pdfparser.utils import extract_metadata, extract_summary_totals, extract_transactions
+from pdfparser.utils import build_parse_result, require_regular_file
 
+# Documents shorter than this are parsed in-process; below it, spawning
+# page workers costs more than the text extraction they parallelize
+PAGE_PARALLEL_MIN_PAGES = 50
 
-def parse_pdf_pymupdf(path: str) -> Dict[str, Any]:
+
+def parse_pdf_pymupdf(path: str, need_full_text: bool = True) -> Dict[str, Any]:
     """
     Parse Indonesian bank statement PDF using PyMuPDF.
 
@@ -22,6 +28,8 @@ def parse_pdf_pymupdf(path: str) -> Dict[str, Any]:
 
     Args:
         path: Path to PDF file (string or Path-like)
+        need_full_text: Include the concatenated page text under 'full_text'
+            (needed for turnover verification); skip it to keep the result small
 
     Returns:
         Dict with keys:
@@ -29,66 +37,122 @@ def parse_pdf_pymupdf(path: str) -> Dict[str, Any]:
                          product_name, statement_date
             - 'transactions': List[Dict[str, str]] with date, description,
                              user, debit, credit, balance
+            - 'full_text': str with text of all pages (only if need_full_text)
 
     Raises:
         FileNotFoundError: If PDF file doesn't exist
         fitz.FileDataError: If PDF is corrupted or invalid
         Exception: For other PDF processing errors
     """
-    # Convert to Path for validation
-    path_obj = Path(path)
+    return _parse_pdf(path, need_full_text, max_workers=1)
+
+
+def get_page_count(path: str) -> int:
+    """
+    Count the pages of a PDF without extracting any text.
+
+    Args:
+        path: Path to PDF file (string or Path-like)
+
+    Returns:
+        Number of pages
+    """
+    with fitz.open(str(path)) as doc:
+        return len(doc)
+
+
+def _extract_page_range(args: Tuple[str, int, int]) -> str:
+    """
+    Extract the text of pages [start, stop) of a PDF in a worker process.
+
+    Each worker opens its own Document: PyMuPDF documents cannot be shared
+    across processes.
 
-    # Validate file existence
-    if not path_obj.exists():
-        raise FileNotFoundError(f"PDF file not found: {path}")
-    if not path_obj.is_file():
-        raise FileNotFoundError(f"Path is not a file: {path}")
+    Args:
+        args: Tuple of (path, start, stop)
+
+    Returns:
+        Text of the pages, each followed by a newline
+    """
+    path, start, stop = args
+    with fitz.open(path) as doc:
+        return "".join(page.get_text("text", sort=False) + "\n" for page in doc.pages(start, stop))
+
+
+def parse_pdf_pymupdf_parallel(
+    path: str,
+    max_workers: Optional[int] = None,
+    need_full_text: bool = True,
+    executor: Optional[Executor] = None,
+) -> Dict[str, Any]:
+    """
+    Parse a long statement PDF by extracting page ranges in parallel.
+
+    The page count is split into one contiguous range per worker process and
+    the page texts are stitched back together in page order, so the result is
+    identical to parse_pdf_pymupdf(). Documents shorter than
+    PAGE_PARALLEL_MIN_PAGES (or max_workers < 2) are parsed in-process.
+
+    Args:
+        path: Path to PDF file (string or Path-like)
+        max_workers: Maximum page worker processes (default: CPU count)
+        need_full_text: Include the concatenated page text under 'full_text'
+        executor: Process pool to run the page ranges on, so callers parsing
+            many files reuse one pool; by default a pool is created per call
+
+    Returns:
+        Same as parse_pdf_pymupdf()
+
+    Raises:
+        Same as parse_pdf_pymupdf()
+    """
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    return _parse_pdf(path, need_full_text, max_workers, executor)
+
+
+def _parse_pdf(
+    path: str, need_full_text: bool, max_workers: int, executor: Optional[Executor] = None
+) -> Dict[str, Any]:
+    """
+    Parse a PDF, splitting long documents across up to max_workers processes.
+
+    The document is opened once here; short documents are extracted from
+    that handle, long ones by _extract_page_range() in page worker processes.
+    """
+    # Validate file existence (one stat call)
+    require_regular_file(path)
 
-    doc = None
     try:
-        # Open PDF document
-        doc = fitz.open(str(path))
-
-        # Handle empty document
-        if len(doc) == 0:
-            raise ValueError(f"PDF has no pages: {path}")
-
-        # Extract metadata from first page
-        first_page_text = doc[0].get_text()
-        metadata = extract_metadata(first_page_text)
-
-        # Fallback: extract account_no from filename if not found in text
-        # Many Indonesian bank PDFs have account number in filename (e.g., 041901001548309)
-        if not metadata.get("account_no"):
-            import re
-
-            # Match 10-16 digit number in filename, but not if it looks like part of date
-            acct_match = re.search(r"(\d{10,16})", path_obj.stem)
-            if acct_match:
-                # Verify it's not a date-like pattern (e.g., 2024-01-15)
-                potential_acct = acct_match.group(1)
-                if not re.match(r"^\d{4}-\d{2}-\d{2}$", potential_acct):
-                    metadata["account_no"] = potential_acct
-
-        # Extract transactions from all pages
-        all_text = ""
-        for page_num in range(len(doc)):
-            page_text = doc[page_num].get_text()
-            all_text += page_text + "\n"
-        transactions = extract_transactions(all_text)
-
-        # Extract summary totals and add to metadata
-        summary = extract_summary_totals(all_text)
-        if summary.get("total_debit"):
-            metadata["total_debit"] = summary["total_debit"]
-        if summary.get("total_credit"):
-            metadata["total_credit"] = summary["total_credit"]
-        if summary.get("opening_balance"):
-            metadata["opening_balance"] = summary["opening_balance"]
-        if summary.get("closing_balance"):
-            metadata["closing_balance"] = summary["closing_balance"]
-
-        return {"metadata": metadata, "transactions": transactions, "full_text": all_text}
+        with fitz.open(str(path)) as doc:
+            # Handle empty document
+            page_count = len(doc)
+            if page_count == 0:
+                raise ValueError(f"PDF has no pages: {path}")
+
+            if page_count < PAGE_PARALLEL_MIN_PAGES or max_workers < 2:
+                # Extract the text of every page once; the first page holds
+                # the metadata header, all pages the transactions
+                page_texts = [page.get_text("text", sort=False) for page in doc]
+                return build_parse_result(
+                    path, page_texts[0], "\n".join(page_texts) + "\n", need_full_text
+                )
+
+            first_page_text = doc[0].get_text("text", sort=False)
+
+        step = -(-page_count // max_workers)  # ceil division
+        ranges = [
+            (str(path), start, min(start + step, page_count))
+            for start in range(0, page_count, step)
+        ]
+        with (
+            ProcessPoolExecutor(max_workers=len(ranges))
+            if executor is None
+            else contextlib.nullcontext(executor)
+        ) as page_pool:
+            all_text = "".join(page_pool.map(_extract_page_range, ranges))
+
+        return build_parse_result(path, first_page_text, all_text, need_full_text)
 
     except FileNotFoundError:
         raise
@@ -96,6 +160,3 @@ def parse_pdf_pymupdf(path: str) -> Dict[str, Any]:
         raise ValueError(f"Corrupted PDF: {path}") from e
     except Exception as e:
         raise RuntimeError(f"Failed to parse PDF: {path}") from e
-    finally:
-        if doc is not None:
-            doc.close()
@@ -11,10 +11,16 @@ from typing import Any, Dict
 from pypdf import PdfReader
 from pypdf.errors import PdfReadError
 
-from pdfparser.utils import extract_metadata, extract_summary_totals, extract_transactions
+from pdfparser.utils import (
+    ACCOUNT_NO_FROM_FILENAME_PATTERN,
+    extract_metadata,
+    extract_summary_totals,
+    extract_transactions,
+    require_regular_file,
+)
 
 
-def parse_pdf_pypdf(path: str) -> Dict[str, Any]:
+def parse_pdf_pypdf(path: str, need_full_text: bool = True) -> Dict[str, Any]:
     """
     Parse Indonesian bank statement PDF using pypdf.
 
@@ -23,6 +29,8 @@ def parse_pdf_pypdf(path: str) -> Dict[str, Any]:
 
     Args:
         path: Path to PDF file (string or Path-like)
+        need_full_text: Include the concatenated page text under 'full_text'
+            (needed for turnover verification); skip it to keep the result small
 
     Returns:
         Dict with keys:
@@ -30,21 +38,17 @@ def parse_pdf_pypdf(path: str) -> Dict[str, Any]:
                          product_name, statement_date
             - 'transactions': List[Dict[str, str]] with date, description,
                              user, debit, credit, balance
+            - 'full_text': str with text of all pages (only if need_full_text)
 
     Raises:
         FileNotFoundError: If PDF file doesn't exist
         ValueError: If PDF is corrupted, invalid, or has no pages
         RuntimeError: For other PDF processing errors
     """
-    # Convert to Path for validation
+    # Validate file existence (one stat call)
+    require_regular_file(path)
     path_obj = Path(path)
 
-    # Validate file existence
-    if not path_obj.exists():
-        raise FileNotFoundError(f"PDF file not found: {path}")
-    if not path_obj.is_file():
-        raise FileNotFoundError(f"Path is not a file: {path}")
-
     try:
         # Open PDF document
         reader = PdfReader(str(path))
@@ -53,24 +57,20 @@ def parse_pdf_pypdf(path: str) -> Dict[str, Any]:
         if len(reader.pages) == 0:
             raise ValueError(f"PDF has no pages: {path}")
 
+        # Extract the text of every page once
+        page_texts = [page.extract_text() or "" for page in reader.pages]
+
         # Extract metadata from first page
-        header_text = reader.pages[0].extract_text()
-        header_text = header_text or ""
-        metadata = extract_metadata(header_text)
+        metadata = extract_metadata(page_texts[0])
 
         # Fallback: extract account_no from filename if not found in text
         if not metadata.get("account_no"):
-            import re
-
-            acct_match = re.search(r"(\d{10,16})", path_obj.stem)
+            acct_match = ACCOUNT_NO_FROM_FILENAME_PATTERN.search(path_obj.stem)
             if acct_match:
                 metadata["account_no"] = acct_match.group(1)
 
         # Extract transactions from all pages
-        all_text = ""
-        for page in reader.pages:
-            page_text = page.extract_text() or ""
-            all_text += page_text + "\n"
+        all_text = "\n".join(page_texts) + "\n"
         transactions = extract_transactions(all_text)
 
         # Extract summary totals and add to metadata
@@ -84,7 +84,10 @@ def parse_pdf_pypdf(path: str) -> Dict[str, Any]:
         if summary.get("closing_balance"):
             metadata["closing_balance"] = summary["closing_balance"]
 
-        return {"metadata": metadata, "transactions": transactions, "full_text": all_text}
+        result: Dict[str, Any] = {"metadata": metadata, "transactions": transactions}
+        if need_full_text:
+            result["full_text"] = all_text
+        return result
 
     except FileNotFoundError:
         raise
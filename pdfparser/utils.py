@@ -5,12 +5,13 @@ This module provides regex patterns and utility functions for extracting
 metadata and transactions from Indonesian bank statements (Rekening Koran).
 """
 
-import csv
+import importlib
 import os
 import re
-from functools import lru_cache
+import stat
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Dict, List, Optional, Pattern
+from typing import Any, Callable, Dict, List, Optional, Pattern
 
 from dotenv import load_dotenv
 
@@ -67,6 +68,12 @@ TOTAL_CREDIT_TRANSACTION_PATTERN: Pattern = re.compile(
     r"Total\s+Credit\s+Transaction\s*[:\s]*([\d\.,]+)", re.IGNORECASE
 )
 
+# Account number fallback: a 10-16 digit run in the PDF's filename
+ACCOUNT_NO_FROM_FILENAME_PATTERN: Pattern = re.compile(r"(\d{10,16})")
+
+# Filename account numbers that are really dates (e.g., 2024-01-15)
+DATE_LIKE_PATTERN: Pattern = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+
 # Additional compiled patterns for faster lookups
 _WHITESPACE_PATTERN: Pattern = re.compile(r"\s+")
 _NUMERIC_LINE_PATTERN: Pattern = re.compile(r"^[\d,.]+\s*$")
@@ -92,6 +99,68 @@ _SUMMARY_LABEL_PATTERNS: List[tuple] = [
     (_SALDO_AKHIR_PATTERN, "closing_balance"),
 ]
 
+# The same labels as whole (stripped) lines of a full text, found in one
+# scan; each named group is the label type, and whitespace stays in its line
+_SUMMARY_LABEL_LINE_PATTERN: Pattern = re.compile(
+    r"^[^\S\n]*(?:"
+    r"(?P<opening_balance>Saldo[^\S\n]+Awal|Opening[^\S\n]+Balance)"
+    r"|(?P<total_debit>Total[^\S\n]+Transaksi[^\S\n]+Debet|Total[^\S\n]+Debit[^\S\n]+Transaction)"
+    r"|(?P<total_credit>Total[^\S\n]+Transaksi[^\S\n]+Kredit|Total[^\S\n]+Credit[^\S\n]+Transaction)"
+    r"|(?P<closing_balance>Saldo[^\S\n]+Akhir|Closing[^\S\n]+Balance)"
+    r")[^\S\n]*$",
+    re.IGNORECASE | re.MULTILINE,
+)
+
+
+# Parser backends: parser name -> (module path, function name)
+# Backends are imported on first use so that only the libraries actually
+# needed by a process (or worker) get loaded.
+PARSER_BACKENDS: Dict[str, tuple] = {
+    "pymupdf": ("pdfparser.pymupdf_parser", "parse_pdf_pymupdf"),
+    "pdfplumber": ("pdfparser.pdfplumber_parser", "parse_pdf_pdfplumber"),
+    "pypdf": ("pdfparser.pypdf_parser", "parse_pdf_pypdf"),
+    "pdfoxide": ("pdfparser.pdfoxide_parser", "parse_pdf_pdfoxide"),
+}
+
+# Parser names accepted by parse_pdf, PDFParser and batch_parse
+VALID_PARSERS = frozenset(PARSER_BACKENDS)
+
+# Resolved parser functions, populated on first use of each backend
+_PARSER_FUNCS: Dict[str, Callable[..., Dict[str, Any]]] = {}
+
+
+def get_parser_func(parser_name: str) -> Callable[..., Dict[str, Any]]:
+    """
+    Import and return the parse function for a parser backend.
+
+    The backend module is imported on first use and the function is cached,
+    so repeated lookups cost a single dict access.
+
+    Args:
+        parser_name: Parser name ('pymupdf', 'pdfplumber', 'pypdf', 'pdfoxide')
+
+    Returns:
+        Parser function taking a PDF path (and need_full_text flag) and
+        returning the raw result dict
+
+    Raises:
+        ValueError: If parser name is invalid
+    """
+    try:
+        return _PARSER_FUNCS[parser_name]
+    except KeyError:
+        pass
+
+    backend = PARSER_BACKENDS.get(parser_name)
+    if backend is None:
+        raise ValueError(
+            f"Invalid parser: {parser_name}. Choose 'pymupdf', 'pdfplumber', 'pypdf', or 'pdfoxide'"
+        )
+    module_path, func_name = backend
+    parser_func = getattr(importlib.import_module(module_path), func_name)
+    _PARSER_FUNCS[parser_name] = parser_func
+    return parser_func
+
 
 @lru_cache(maxsize=128)
 def get_cached_pattern(pattern: str, flags: int = 0) -> Pattern:
@@ -111,19 +180,44 @@ def get_cached_pattern(pattern: str, flags: int = 0) -> Pattern:
     return re.compile(pattern, flags)
 
 
+def require_regular_file(path: str) -> None:
+    """
+    Check that path is an existing regular file with a single stat() call.
+
+    Args:
+        path: Path to check (string or Path-like)
+
+    Raises:
+        FileNotFoundError: If path doesn't exist or is not a regular file
+    """
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"PDF file not found: {path}") from None
+    if not stat.S_ISREG(st.st_mode):
+        raise FileNotFoundError(f"Path is not a file: {path}")
+
+
+@lru_cache(maxsize=1)
 def load_config() -> Dict[str, str]:
     """
     Load configuration from environment variables.
 
     Reads from .env file if present, otherwise uses defaults.
+    The result is cached after the first call, so the returned dict is shared
+    and must not be mutated; call load_config.cache_clear() to pick up
+    environment changes made afterwards.
     Environment variables:
         - SOURCE_PDF_DIR: Directory containing source PDF files
         - OUTPUT_DIR: Directory for output CSV files
         - TEST_PDFS_DIR: Directory for test/benchmark PDF files
         - VERIFY_TURNOVER: Enable turnover verification ('true' or 'false')
+        - WORKER_START_METHOD: multiprocessing start method for batch process
+          pools ('fork', 'spawn' or 'forkserver'; default: platform default)
 
     Returns:
-        Dict with keys: source_pdf_dir, output_dir, test_pdfs_dir, verify_turnover
+        Dict with keys: source_pdf_dir, output_dir, test_pdfs_dir, verify_turnover,
+        worker_start_method
     """
     # Load .env file if it exists (silent if missing)
     load_dotenv()
@@ -133,6 +227,7 @@ def load_config() -> Dict[str, str]:
         "output_dir": os.getenv("OUTPUT_DIR", "output"),
         "test_pdfs_dir": os.getenv("TEST_PDFS_DIR", "test-pdfs"),
         "verify_turnover": os.getenv("VERIFY_TURNOVER", "false"),
+        "worker_start_method": os.getenv("WORKER_START_METHOD", ""),
     }
 
 
@@ -425,7 +520,16 @@ def _format_number_for_csv(value: str) -> str:
     return formatted
 
 
-def save_metadata_csv(metadata: Dict[str, str], output_path: str) -> None:
+def _opener_at(dir_fd: Optional[int]) -> Optional[Callable[[str, int], int]]:
+    """Return an open() opener resolving paths relative to dir_fd (None: the default)."""
+    if dir_fd is None:
+        return None
+    return partial(os.open, mode=0o666, dir_fd=dir_fd)
+
+
+def save_metadata_csv(
+    metadata: Dict[str, str], output_path: str, dir_fd: Optional[int] = None
+) -> None:
     """
     Write metadata dict to CSV file with Field and Value columns.
 
@@ -434,51 +538,70 @@ def save_metadata_csv(metadata: Dict[str, str], output_path: str) -> None:
     Args:
         metadata: Dict of metadata fields
         output_path: Path where CSV file will be written
+        dir_fd: Open directory descriptor that output_path is relative to
+            (skips resolving the directory path on every write)
     """
-    with open(output_path, "w", newline="", encoding="utf-8") as csvfile:
-        writer = csv.writer(csvfile, delimiter=";")
-        writer.writerow(["Field", "Value"])
-        for field, value in metadata.items():
-            # Format numeric values
-            formatted_value = _format_number_for_csv(value) if value else ""
-            writer.writerow([field, formatted_value])
+    # Format numeric values; the whole file is built first and written with
+    # a single write() call
+    content = "Field;Value\r\n" + "".join(
+        f"{_csv_field(field)};{_csv_field(_format_number_for_csv(value) if value else '')}\r\n"
+        for field, value in metadata.items()
+    )
+    with open(
+        output_path, "w", newline="", encoding="utf-8", opener=_opener_at(dir_fd)
+    ) as csvfile:
+        csvfile.write(content)
 
 
-def save_transactions_csv(transactions: List[Dict[str, str]], output_path: str) -> None:
+def _csv_field(value: str) -> str:
+    """
+    Quote a field exactly as csv.writer(delimiter=";") does by default.
+
+    Args:
+        value: Field value
+
+    Returns:
+        The value, quoted (with embedded quotes doubled) only if it contains
+        a semicolon, quote, or line break
+    """
+    if '"' in value:
+        return '"' + value.replace('"', '""') + '"'
+    if ";" in value or "\n" in value or "\r" in value:
+        return '"' + value + '"'
+    return value
+
+
+def save_transactions_csv(
+    transactions: List[Dict[str, str]], output_path: str, dir_fd: Optional[int] = None
+) -> None:
     """
     Write transactions list to CSV file.
 
     Uses semicolon (;) as delimiter and formats numbers without thousand separators.
     Output columns: Date, Description, User, Debit, Credit, Balance
 
+    Rows are formatted directly rather than through csv.DictWriter; the
+    output is byte-for-byte what csv.writer would produce.
+
     Args:
         transactions: List of transaction dicts
         output_path: Path where CSV file will be written
+        dir_fd: Open directory descriptor that output_path is relative to
     """
-    if not transactions:
-        # Write empty CSV with headers
-        with open(output_path, "w", newline="", encoding="utf-8") as csvfile:
-            writer = csv.writer(csvfile, delimiter=";")
-            writer.writerow(["Date", "Description", "User", "Debit", "Credit", "Balance"])
-        return
-
-    fieldnames = ["Date", "Description", "User", "Debit", "Credit", "Balance"]
-
-    with open(output_path, "w", newline="", encoding="utf-8") as csvfile:
-        writer = csv.DictWriter(csvfile, fieldnames=fieldnames, delimiter=";")
-        writer.writeheader()
-
-        for txn in transactions:
-            writer.writerow(
-                {
-                    "Date": txn.get("date", ""),
-                    "Description": txn.get("description", ""),
-                    "User": txn.get("user", ""),
-                    "Debit": _format_number_for_csv(txn.get("debit", "")),
-                    "Credit": _format_number_for_csv(txn.get("credit", "")),
-                    "Balance": _format_number_for_csv(txn.get("balance", "")),
-                }
-            )
+    # Build the whole file first so it goes out in a single write() call
+    content = "Date;Description;User;Debit;Credit;Balance\r\n" + "".join(
+        f"{_csv_field(txn.get('date') or '')};"
+        f"{_csv_field(txn.get('description') or '')};"
+        f"{_csv_field(txn.get('user') or '')};"
+        f"{_csv_field(_format_number_for_csv(txn.get('debit', '')))};"
+        f"{_csv_field(_format_number_for_csv(txn.get('credit', '')))};"
+        f"{_csv_field(_format_number_for_csv(txn.get('balance', '')))}\r\n"
+        for txn in transactions
+    )
+    with open(
+        output_path, "w", newline="", encoding="utf-8", opener=_opener_at(dir_fd)
+    ) as csvfile:
+        csvfile.write(content)
 
 
 def is_valid_parse(metadata: Dict[str, str], transactions: List[Dict[str, str]]) -> bool:
@@ -584,18 +707,23 @@ def extract_summary_totals(text: str) -> Dict[str, Optional[str]]:
     _numeric_only_match = _NUMERIC_ONLY_PATTERN.match
     _numeric_line_match = _NUMERIC_LINE_PATTERN.match
 
-    # Find positions of unique summary labels (deduplicate)
+    # Find positions of unique summary labels (deduplicate) in one scan of
+    # the text, counting newlines to turn match offsets into line numbers
     # Track which label types we've already found
     found_types = set()
     all_labels = []
-    for i, line in enumerate(lines):
-        line_clean = line.strip()
-        for pattern, label_type in _SUMMARY_LABEL_PATTERNS:
-            if pattern.match(line_clean):
-                if label_type not in found_types:
-                    all_labels.append((label_type, i))
-                    found_types.add(label_type)
-                break
+    line_no = 0
+    line_pos = 0
+    for match in _SUMMARY_LABEL_LINE_PATTERN.finditer(text):
+        label_type = match.lastgroup
+        if label_type in found_types:
+            continue
+        line_no += text.count("\n", line_pos, match.start())
+        line_pos = match.start()
+        all_labels.append((label_type, line_no))
+        found_types.add(label_type)
+        if len(found_types) == len(_SUMMARY_LABEL_PATTERNS):
+            break
 
     # Find the summary section values (numbers after labels)
     if all_labels:
@@ -649,6 +777,53 @@ def extract_summary_totals(text: str) -> Dict[str, Optional[str]]:
     return result
 
 
+def build_parse_result(
+    path: str, first_page_text: str, all_text: str, need_full_text: bool
+) -> Dict[str, Any]:
+    """
+    Build a parser result dict from a statement's extracted text.
+
+    Args:
+        path: Path of the parsed PDF (used for the account number fallback)
+        first_page_text: Text of the first page (metadata header)
+        all_text: Text of all pages, each followed by a newline
+        need_full_text: Include all_text under 'full_text'
+
+    Returns:
+        Dict with 'metadata', 'transactions' and optionally 'full_text'
+    """
+    metadata = extract_metadata(first_page_text)
+
+    # Fallback: extract account_no from filename if not found in text
+    # Many Indonesian bank PDFs have account number in filename (e.g., 041901001548309)
+    if not metadata.get("account_no"):
+        # Match 10-16 digit number in filename, but not if it looks like part of date
+        acct_match = ACCOUNT_NO_FROM_FILENAME_PATTERN.search(Path(path).stem)
+        if acct_match:
+            # Verify it's not a date-like pattern (e.g., 2024-01-15)
+            potential_acct = acct_match.group(1)
+            if not DATE_LIKE_PATTERN.match(potential_acct):
+                metadata["account_no"] = potential_acct
+
+    transactions = extract_transactions(all_text)
+
+    # Extract summary totals and add to metadata
+    summary = extract_summary_totals(all_text)
+    if summary.get("total_debit"):
+        metadata["total_debit"] = summary["total_debit"]
+    if summary.get("total_credit"):
+        metadata["total_credit"] = summary["total_credit"]
+    if summary.get("opening_balance"):
+        metadata["opening_balance"] = summary["opening_balance"]
+    if summary.get("closing_balance"):
+        metadata["closing_balance"] = summary["closing_balance"]
+
+    result: Dict[str, Any] = {"metadata": metadata, "transactions": transactions}
+    if need_full_text:
+        result["full_text"] = all_text
+    return result
+
+
 def calculate_debit_sum(transactions: List[Dict[str, str]]) -> float:
     """
     Calculate the sum of all debit amounts from transactions.
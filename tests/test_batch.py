@@ -12,11 +12,13 @@ import time
 
 import pytest
 
+import pdfparser.batch as batch_module
 from pdfparser.batch import (
     BatchResult,
     WorkerConfig,
     batch_parse,
     batch_parse_from_directory,
+    batch_parse_iter,
     get_optimal_workers,
     get_worker_config,
     validate_batch_params,
@@ -37,17 +39,21 @@ class TestGetOptimalWorkers:
         workers = get_optimal_workers("pymupdf")
         assert isinstance(workers, int)
 
-    def test_different_parsers_return_same(self):
-        """Test that different parsers return similar worker counts."""
-        workers_pymupdf = get_optimal_workers("pymupdf")
-        workers_pdfplumber = get_optimal_workers("pdfplumber")
-        workers_pypdf = get_optimal_workers("pypdf")
-        workers_pdfoxide = get_optimal_workers("pdfoxide")
+    def test_parser_specific_caps(self):
+        """Test that parser-specific worker caps are applied."""
+        assert get_optimal_workers("pymupdf") <= 6
+        assert get_optimal_workers("pdfplumber") <= 4
+        assert get_optimal_workers("pypdf") <= 16
 
-        # All should return same capped value
-        assert workers_pymupdf == workers_pdfplumber
-        assert workers_pdfplumber == workers_pypdf
-        assert workers_pypdf == workers_pdfoxide
+    def test_threaded_parser_scales_past_process_cap(self, monkeypatch):
+        """Test that GIL-releasing threaded parsers scale with CPU count up to 32."""
+        monkeypatch.setattr("pdfparser.batch.os.cpu_count", lambda: 64)
+        assert get_optimal_workers("pdfoxide") == 32
+        assert get_optimal_workers("pypdf") == 16
+
+    def test_pdfplumber_not_above_pymupdf(self):
+        """Test that memory-heavy pdfplumber never gets more workers than pymupdf."""
+        assert get_optimal_workers("pdfplumber") <= get_optimal_workers("pymupdf")
 
 
 class TestGetWorkerConfig:
@@ -143,6 +149,13 @@ class TestBatchParse:
         assert result["total"] == 0
         assert result["failed"] == 1
 
+    def test_skipped_files_logged(self, tmp_path, caplog):
+        """Test that skipped paths are reported through logging."""
+        missing = str(tmp_path / "nonexistent.pdf")
+        with caplog.at_level("WARNING", logger="pdfparser.batch"):
+            batch_parse([missing])
+        assert f"File not found, skipping: {missing}" in caplog.text
+
     def test_directory_not_a_file_skipped(self, tmp_path):
         """Test that directories are skipped."""
         result = batch_parse([str(tmp_path)])
@@ -203,11 +216,186 @@ class TestBatchParse:
         result = batch_parse(sample_pdf_files, parser_name="pymupdf", init_strategy="per-file")
         assert result["total"] == 3
 
+    def test_combined_outputs(self, sample_pdf_files, tmp_path):
+        """Test that split_outputs=False writes combined CSVs with a File column."""
+        output_dir = tmp_path / "combined"
+        result = batch_parse(
+            sample_pdf_files,
+            parser_name="pymupdf",
+            output_dir=str(output_dir),
+            split_outputs=False,
+        )
+        assert result["total"] == 3
+
+        metadata_csv = output_dir / "all_metadata.csv"
+        transactions_csv = output_dir / "all_transactions.csv"
+        assert metadata_csv.read_text(encoding="utf-8").startswith("File;Field;Value")
+        assert transactions_csv.read_text(encoding="utf-8").startswith(
+            "File;Date;Description;User;Debit;Credit;Balance"
+        )
+
     def test_invalid_parser_raises_error(self, sample_pdf_files):
         """Test that invalid parser raises ValueError."""
         with pytest.raises(ValueError):
             batch_parse(sample_pdf_files, parser_name="invalid")
 
+    def test_ndjson_output_creates_results_file(self, sample_pdf_files, tmp_path):
+        """Test that output_format='ndjson' writes a single all_results.ndjson."""
+        output_dir = tmp_path / "ndjson"
+        result = batch_parse(
+            sample_pdf_files,
+            parser_name="pymupdf",
+            output_dir=str(output_dir),
+            output_format="ndjson",
+        )
+        assert result["total"] == 3
+        assert (output_dir / "all_results.ndjson").exists()
+
+    def test_invalid_output_format_raises_error(self, sample_pdf_files):
+        """Test that an unknown output_format raises ValueError."""
+        with pytest.raises(ValueError):
+            batch_parse(sample_pdf_files, output_format="xml")
+
+    def test_collect_results_false(self, sample_pdf_files, tmp_path):
+        """Test that collect_results=False keeps counters but drops per-file results."""
+        result = batch_parse(
+            sample_pdf_files,
+            parser_name="pymupdf",
+            output_dir=str(tmp_path / "output"),
+            collect_results=False,
+        )
+        assert result["total"] == 3
+        assert result["successful"] + result["failed"] == 3
+        assert result["results"] == []
+
+    def test_non_pdf_files_rejected(self, tmp_path):
+        """Test that empty and non-PDF files fail fast with a clear error."""
+        empty_file = tmp_path / "empty.pdf"
+        empty_file.write_bytes(b"")
+        text_file = tmp_path / "text.pdf"
+        text_file.write_text("not a pdf")
+
+        result = batch_parse(
+            [str(empty_file), str(text_file)],
+            parser_name="pymupdf",
+            output_dir=str(tmp_path / "output"),
+        )
+        assert result["failed"] == 2
+        # Results come back largest file first, so look errors up by file
+        errors = {r["file_name"]: r["error"] for r in result["results"]}
+        assert errors["empty.pdf"].startswith("Empty file")
+        assert errors["text.pdf"].startswith("Not a PDF")
+
+
+class TestBatchParseIter:
+    """Tests for batch_parse_iter() generator."""
+
+    def test_yields_one_result_per_file(self, tmp_path):
+        """Test that each input file yields one result; equal sizes keep input order."""
+        paths = []
+        for i in range(3):
+            file_path = tmp_path / f"test_{i}.pdf"
+            file_path.write_text("%PDF-1.4 mock PDF content")
+            paths.append(str(file_path))
+
+        seen = []
+        results = list(
+            batch_parse_iter(
+                paths,
+                parser_name="pymupdf",
+                output_dir=str(tmp_path / "output"),
+                progress_callback=seen.append,
+            )
+        )
+        assert [r["file_path"] for r in results] == paths
+        assert seen == results
+
+    def test_largest_files_first(self, tmp_path):
+        """Test that results come back largest file first."""
+        paths = []
+        for i, padding in enumerate([10, 1000, 100]):
+            file_path = tmp_path / f"test_{i}.pdf"
+            file_path.write_text("%PDF-1.4 mock PDF content" + " " * padding)
+            paths.append(str(file_path))
+
+        results = list(
+            batch_parse_iter(paths, parser_name="pymupdf", output_dir=str(tmp_path / "output"))
+        )
+        assert [r["file_path"] for r in results] == [paths[1], paths[2], paths[0]]
+
+    def test_threaded_parser_leaves_worker_state_alone(self, tmp_path, monkeypatch):
+        """Test that thread pool batches do not overwrite the per-worker globals."""
+        monkeypatch.setattr(batch_module, "_WORKER_PARSER_NAME", "pymupdf")
+        file_path = tmp_path / "test.pdf"
+        file_path.write_text("%PDF-1.4 mock PDF content")
+
+        results = list(
+            batch_parse_iter(
+                [str(file_path)], parser_name="pdfoxide", output_dir=str(tmp_path / "output")
+            )
+        )
+        assert len(results) == 1
+        assert batch_module._WORKER_PARSER_NAME == "pymupdf"
+
+    def test_missing_files_yield_nothing(self, tmp_path):
+        """Test that nonexistent paths are skipped."""
+        results = list(
+            batch_parse_iter([str(tmp_path / "missing.pdf")], output_dir=str(tmp_path))
+        )
+        assert results == []
+
+    def test_invalid_parser_raises_error(self):
+        """Test that invalid parser raises ValueError on first iteration."""
+        with pytest.raises(ValueError):
+            next(batch_parse_iter(["a.pdf"], parser_name="invalid"))
+
+
+class TestProcessPoolContext:
+    """Tests for the batch process pool's start method."""
+
+    @pytest.fixture(autouse=True)
+    def fresh_config(self):
+        """Re-read the environment before and after each test."""
+        batch_module.load_config.cache_clear()
+        yield
+        batch_module.load_config.cache_clear()
+
+    def test_platform_default_when_unset(self, monkeypatch):
+        """Test that no start method is forced by default."""
+        monkeypatch.delenv("WORKER_START_METHOD", raising=False)
+        assert batch_module._process_pool_context() is None
+
+    def test_start_method_from_environment(self, monkeypatch):
+        """Test that WORKER_START_METHOD picks the pool's start method."""
+        monkeypatch.setenv("WORKER_START_METHOD", "spawn")
+        assert batch_module._process_pool_context().get_start_method() == "spawn"
+
+
+class TestLongDocuments:
+    """Tests for picking the PDFs a small batch splits across page workers."""
+
+    def test_only_long_documents_are_split(self, monkeypatch):
+        """Test that short PDFs stay file-level tasks in a small batch."""
+        pymupdf_parser = pytest.importorskip("pdfparser.pymupdf_parser")
+        monkeypatch.setattr(pymupdf_parser, "get_page_count", lambda path: len(path))
+
+        short_path, long_path = "a.pdf", "a" * 60 + ".pdf"
+        long_paths, page_parser = batch_module._long_documents(
+            "pymupdf", [short_path, long_path], max_workers=16
+        )
+        assert long_paths == [long_path]
+        assert page_parser is not None
+
+    def test_large_batch_is_not_split(self, monkeypatch):
+        """Test that a batch that fills the pool never reads page counts."""
+        pymupdf_parser = pytest.importorskip("pdfparser.pymupdf_parser")
+        monkeypatch.setattr(pymupdf_parser, "get_page_count", pytest.fail)
+
+        assert batch_module._long_documents("pymupdf", ["a.pdf"] * 8, max_workers=16) == (
+            [],
+            None,
+        )
+
 
 class TestBatchParseFromDirectory:
     """Tests for batch_parse_from_directory() function."""
@@ -358,10 +546,9 @@ class TestPerformanceMetrics:
 
         result = batch_parse(files, parser_name="pymupdf")
 
-        # Worker overhead should be a small percentage
-        assert result["worker_overhead_percent"] >= 0
-        # Should be less than 50% for any reasonable implementation
-        assert result["worker_overhead_percent"] < 50
+        # Measured as the wait for the first result, a share of the duration;
+        # pool startup dominates a batch of five instant failures
+        assert 0 < result["worker_overhead_percent"] <= 100
 
 
 if __name__ == "__main__":
@@ -151,6 +151,66 @@ class TestIsValidParse:
         assert result is False
 
 
+class TestPymupdfPageParallel:
+    """Tests for the page-parallel PyMuPDF parser."""
+
+    def test_matches_sequential_parser(self, monkeypatch):
+        """Verify splitting pages across workers gives the same result."""
+        if not EXAMPLE_STATEMENT_PDF.exists():
+            pytest.skip("Test PDF not found")
+        pymupdf_parser = pytest.importorskip("pdfparser.pymupdf_parser")
+
+        # Force the split even for a short document
+        monkeypatch.setattr(pymupdf_parser, "PAGE_PARALLEL_MIN_PAGES", 1)
+        expected = pymupdf_parser.parse_pdf_pymupdf(str(EXAMPLE_STATEMENT_PDF))
+        result = pymupdf_parser.parse_pdf_pymupdf_parallel(
+            str(EXAMPLE_STATEMENT_PDF), max_workers=2
+        )
+        assert result == expected
+
+
+class TestPdfoxidePageParallel:
+    """Tests for the page-parallel pdf_oxide parser."""
+
+    def test_matches_sequential_parser(self, monkeypatch):
+        """Verify splitting pages across threads gives the same result."""
+        if not EXAMPLE_STATEMENT_PDF.exists():
+            pytest.skip("Test PDF not found")
+        pdfoxide_parser = pytest.importorskip("pdfparser.pdfoxide_parser")
+
+        # Force the split even for a short document
+        monkeypatch.setattr(pdfoxide_parser, "PAGE_PARALLEL_MIN_PAGES", 1)
+        expected = pdfoxide_parser.parse_pdf_pdfoxide(str(EXAMPLE_STATEMENT_PDF))
+        result = pdfoxide_parser.parse_pdf_pdfoxide_parallel(
+            str(EXAMPLE_STATEMENT_PDF), max_workers=2
+        )
+        assert result == expected
+
+
+class TestExtractTransactionsInline:
+    """Tests for pdfplumber's inline transaction extraction."""
+
+    def test_skips_headers_and_parses_rows(self):
+        """Verify header lines are skipped and each row is parsed on its own line."""
+        pdfplumber_parser = pytest.importorskip("pdfparser.pdfplumber_parser")
+        text = (
+            "Tanggal Transaksi  Uraian Transaksi  Teller  Debet  Kredit  Saldo\n"
+            "  01/02/24 12:30:45 TRF KE BUDI  u1  1,000.00  5,000.00  \n"
+            "\n"
+            "Opening Balance 01/02/24 x u1 1 2 3\n"
+        )
+        assert pdfplumber_parser.extract_transactions_inline(text) == [
+            {
+                "date": "01/02/24",
+                "description": "12:30:45 TRF KE BUDI",
+                "user": "u1",
+                "debit": "1,000.00",
+                "credit": "",
+                "balance": "5,000.00",
+            }
+        ]
+
+
 class TestReportlabPdfGeneration:
     """Tests using reportlab to generate mini-PDFs for parser testing."""
 
@@ -209,6 +269,9 @@ class TestVerifyTurnover:
         config = load_config()
         assert config["verify_turnover"] == "true"
 
+        # Drop the cached env-overridden config so later tests re-read it
+        load_config.cache_clear()
+
     def test_verify_turnover_function_returns_dict(self):
         """Verify verify_turnover function returns a dictionary."""
         from pdfparser.utils import verify_turnover
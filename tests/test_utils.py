@@ -254,6 +254,20 @@ class TestLoadConfig:
         # Should return string 'false' when not set in .env
         assert result["verify_turnover"] == "false"
 
+    def test_load_config_is_cached(self):
+        """Verify repeated load_config calls return the cached config."""
+        assert load_config() is load_config()
+
+    def test_load_config_cache_clear_picks_up_env(self, monkeypatch):
+        """Verify cache_clear makes load_config re-read the environment."""
+        monkeypatch.setenv("OUTPUT_DIR", "cached-output-test")
+        load_config.cache_clear()
+        try:
+            assert load_config()["output_dir"] == "cached-output-test"
+        finally:
+            monkeypatch.undo()
+            load_config.cache_clear()
+
     def test_load_config_values_are_strings(self):
         """Verify all config values are strings."""
         result = load_config()
@@ -427,3 +441,87 @@ class TestCalculateCreditSum:
         ]
         result = calculate_credit_sum(transactions)
         assert result == 400000.75
+
+
+class TestSaveTransactionsCsv:
+    """Tests for save_transactions_csv() function."""
+
+    def test_round_trips_through_csv_reader(self, tmp_path):
+        """Verify special characters are quoted the way csv.reader expects."""
+        import csv
+
+        from pdfparser.utils import save_transactions_csv
+
+        transactions = [
+            {
+                "date": "01/01/2024",
+                "description": 'TRANSFER; "KE" BANK\nLINE 2',
+                "user": "USER1",
+                "debit": "1.000.000,00",
+                "credit": "",
+                "balance": "5.000.000,50",
+            },
+        ]
+        output_path = tmp_path / "transactions.csv"
+        save_transactions_csv(transactions, str(output_path))
+
+        with open(output_path, newline="", encoding="utf-8") as csvfile:
+            rows = list(csv.reader(csvfile, delimiter=";"))
+        assert rows == [
+            ["Date", "Description", "User", "Debit", "Credit", "Balance"],
+            ["01/01/2024", 'TRANSFER; "KE" BANK\nLINE 2', "USER1", "1000000", "", "5000000.50"],
+        ]
+
+    def test_empty_transactions_writes_header(self, tmp_path):
+        """Verify an empty list still produces the header row."""
+        from pdfparser.utils import save_transactions_csv
+
+        output_path = tmp_path / "transactions.csv"
+        save_transactions_csv([], str(output_path))
+        assert output_path.read_bytes() == b"Date;Description;User;Debit;Credit;Balance\r\n"
+
+
+class TestRequireRegularFile:
+    """Tests for require_regular_file() function."""
+
+    def test_accepts_regular_file(self, tmp_path):
+        """Verify an existing file passes."""
+        from pdfparser.utils import require_regular_file
+
+        file_path = tmp_path / "statement.pdf"
+        file_path.write_bytes(b"%PDF-1.4")
+        require_regular_file(str(file_path))
+
+    def test_missing_file_raises(self, tmp_path):
+        """Verify a missing path raises FileNotFoundError."""
+        from pdfparser.utils import require_regular_file
+
+        with pytest.raises(FileNotFoundError, match="PDF file not found"):
+            require_regular_file(str(tmp_path / "missing.pdf"))
+
+    def test_directory_raises(self, tmp_path):
+        """Verify a directory raises FileNotFoundError."""
+        from pdfparser.utils import require_regular_file
+
+        with pytest.raises(FileNotFoundError, match="Path is not a file"):
+            require_regular_file(str(tmp_path))
+
+
+class TestBuildParseResult:
+    """Tests for build_parse_result() function."""
+
+    def test_account_no_from_filename(self):
+        """Verify the filename account number is used when the header has none."""
+        from pdfparser.utils import build_parse_result
+
+        result = build_parse_result("/tmp/041901001548309_jan.pdf", "", "", need_full_text=False)
+        assert result["metadata"]["account_no"] == "041901001548309"
+        assert result["transactions"] == []
+        assert "full_text" not in result
+
+    def test_full_text_included_on_request(self):
+        """Verify all_text is returned under 'full_text' when requested."""
+        from pdfparser.utils import build_parse_result
+
+        result = build_parse_result("statement.pdf", "", "page one\n", need_full_text=True)
+        assert result["full_text"] == "page one\n"